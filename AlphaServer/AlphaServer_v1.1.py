@@ -1,57 +1,122 @@
 import json
+import os
+import re
+import threading
 import time
+from functools import lru_cache
 from flask import Flask, request, jsonify
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 app = Flask(__name__)
 
+TRIGGER_PATH = "caps_action_trigger.json"
+
+# CAPS_DURABLE=1 이면 trigger 파일 교체 시 fsync까지 수행
+DURABLE = os.environ.get("CAPS_DURABLE") == "1"
+
+# CAPS_PRETTY=1 이면 최신 계획 파일을 들여쓰기해서 기록 (디버깅용, 기본은 한 줄 JSON)
+PRETTY = os.environ.get("CAPS_PRETTY") == "1"
+
 
 # -------------------------------------------------
 # 1) 자연어 → CAPS 명령 토큰 매핑
 # -------------------------------------------------
+# (토큰, 키워드) - 위에 있을수록 우선순위가 높다
+COMMAND_KEYWORDS = (
+    ("MAKE_POST", ("포스팅", "게시물")),
+    ("CHECK_STATUS", ("점검", "상태")),
+    ("FORCE_SYNC", ("동기화", "싱크")),
+)
+
+# 모든 키워드를 하나의 정규식으로 묶어 텍스트를 한 번만 스캔한다
+_COMMAND_RE = re.compile("|".join(
+    f"(?P<{token}>{'|'.join(map(re.escape, words))})"
+    for token, words in COMMAND_KEYWORDS
+))
+_COMMAND_RANK = {token: rank for rank, (token, _) in enumerate(COMMAND_KEYWORDS)}
+
+
+@lru_cache(maxsize=1024)
+def _match_command(text):
+    best = "UNKNOWN"
+    best_rank = len(COMMAND_KEYWORDS)
+    for m in _COMMAND_RE.finditer(text):
+        rank = _COMMAND_RANK[m.lastgroup]
+        if rank < best_rank:
+            best, best_rank = m.lastgroup, rank
+            if rank == 0:
+                break
+    return best
+
+
 def parse_command(text):
     """
     자연어 명령을 CAPS 내부 토큰으로 변환하는 단순 매퍼.
     Slack Slash Command는 form-data(text)로 온다.
     """
-    text = text.lower().strip()
-
-    if "포스팅" in text or "게시물" in text:
-        return "MAKE_POST"
-    if "점검" in text or "상태" in text:
-        return "CHECK_STATUS"
-    if "동기화" in text or "싱크" in text:
-        return "FORCE_SYNC"
-
-    return "UNKNOWN"
+    return _match_command(text.lower().strip())
 
 
 # -------------------------------------------------
 # 2) CAPS Core 실행 계획 생성
 # -------------------------------------------------
+# 고정 필드는 템플릿으로 한 번만 만들어 두고 요청마다 복사해서 사용
+_PLAN_TEMPLATE = {
+    "timestamp": 0,
+    "command": None,
+    "raw_text": None,
+    "priority": "normal",
+    "source": "slack",
+    "autosync_trigger": True
+}
+
+
 def generate_execution_plan(command_token, user_text):
     """
     AutoSync가 읽는 계획 JSON을 구성.
     """
-    plan = {
-        "timestamp": int(time.time()),
-        "command": command_token,
-        "raw_text": user_text,
-        "priority": "normal",
-        "source": "slack",
-        "autosync_trigger": True
-    }
+    plan = _PLAN_TEMPLATE.copy()
+    plan["timestamp"] = time.time_ns() // 1_000_000_000
+    plan["command"] = command_token
+    plan["raw_text"] = user_text
     return plan
 
 
 # -------------------------------------------------
 # 3) AutoSync 트리거 파일 저장
 # -------------------------------------------------
+# 요청 스레드끼리 같은 임시 파일을 동시에 쓰지 않도록
+_trigger_lock = threading.Lock()
+
+
 def write_autosync_trigger(plan):
     """
     AutoSync가 감지하는 trigger 파일을 생성한다.
     """
-    with open("caps_action_trigger.json", "w", encoding="utf-8") as f:
-        json.dump(plan, f, indent=4, ensure_ascii=False)
+    if orjson is not None:
+        # orjson: bytes로 바로 직렬화 (한글은 escape 없이 UTF-8 그대로)
+        data = orjson.dumps(plan, option=orjson.OPT_INDENT_2 if PRETTY else 0)
+    else:
+        data = json.dumps(plan, indent=4 if PRETTY else None, ensure_ascii=False).encode("utf-8")
+
+    # 임시 파일에 쓴 뒤 교체 (읽는 쪽이 반쯤 쓰인 파일을 보지 않도록)
+    tmp_path = TRIGGER_PATH + ".tmp"
+    with _trigger_lock:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if DURABLE:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, TRIGGER_PATH)
 
 
 # -------------------------------------------------
@@ -72,12 +137,15 @@ def slack_receive():
     write_autosync_trigger(plan)
 
     # Slack에게 응답
-    return jsonify({
+    response = {
         "status": "ok",
         "received": user_text,
         "token": command_token,
         "message": "AlphaServer v1.1 명령 처리 완료"
-    })
+    }
+    if orjson is not None:
+        return app.response_class(orjson.dumps(response), mimetype="application/json")
+    return jsonify(response)
 
 
 # -------------------------------------------------
@@ -85,4 +153,9 @@ def slack_receive():
 # -------------------------------------------------
 if __name__ == "__main__":
     print("AlphaServer v1.1 started")
-    app.run(host="0.0.0.0", port=8080)
+    if serve is not None:
+        # waitress: 멀티스레드 WSGI 서버 (Windows 지원)
+        serve(app, host="0.0.0.0", port=8080, threads=8)
+    else:
+        # Flask 개발 서버는 기본이 단일 처리이므로 요청별 스레드로 실행
+        app.run(host="0.0.0.0", port=8080, threaded=True)
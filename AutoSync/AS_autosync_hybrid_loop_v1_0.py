@@ -36,22 +36,21 @@ from __future__ import annotations
 
 import argparse
 import time
-from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 # AutoSync LTS / Core 가져오기
 from AS_autosync_lts_v4_0 import AutoSyncLTS, AUTOSYNC_VERSION as LTS_VERSION  # :contentReference[oaicite:1]{index=1}
 from autosync_core import autosync_run  # :contentReference[oaicite:2]{index=2}
+from log_utils import get_queue_logger
 
 
 HYBRID_VERSION = "1.0.0"
 MODULE_NAME = "AutoSyncHybridLoop"
 
 
-@dataclass
-class LoopStats:
+class LoopStats(NamedTuple):
     loop_index: int
     patched_count: int
     state: str
@@ -64,25 +63,26 @@ class HybridRunner:
         self.logs_dir = self.base_dir / "logs"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
+        # 로그는 큐에 넣기만 하고, 파일 기록은 백그라운드 스레드가 처리
+        self._logger = get_queue_logger(self.logs_dir, "autosync_hybrid")
+
+        # LTS 인스턴스는 한 번만 만들고 루프마다 재사용 (설정은 변경됐을 때만 다시 읽음)
+        self.autosync = AutoSyncLTS(self.base_dir)
+
     # ─────────────────────────────
     # 로깅
     # ─────────────────────────────
     def _log(self, msg: str) -> None:
-        now = datetime.now()
-        date_str = now.strftime("%Y%m%d")
-        log_path = self.logs_dir / f"autosync_hybrid_{date_str}.txt"
-        line = f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {msg}\n"
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(line)
-        print(line, end="")
+        self._logger.info(msg)
 
     # ─────────────────────────────
     # LTS 1회 실행 래핑
     # ─────────────────────────────
     def _run_lts_once(self, dry_run: bool = False) -> Dict[str, Any]:
-        autosync = AutoSyncLTS(self.base_dir)
+        if self.autosync.reload_config():
+            self._log("[INFO] LTS 설정 파일 변경 감지 → 다시 읽음")
         self._log(f"[INFO] LTS 실행 (dry_run={dry_run}) 시작")
-        result = autosync.run_from_plan(dry_run=dry_run)
+        result = self.autosync.run_from_plan(dry_run=dry_run)
         self._log(f"[INFO] LTS 실행 종료: state={result.get('state')}, patched={len(result.get('patch_results', []))}")
         return result
 
@@ -175,7 +175,7 @@ class HybridRunner:
             "loops_ran": loops_ran,
             "total_patched": total_patched,
             "last_state": last_state,
-            "loop_stats": [ls.__dict__ for ls in loop_stats],
+            "loop_stats": [ls._asdict() for ls in loop_stats],
         }
 
         self._log(
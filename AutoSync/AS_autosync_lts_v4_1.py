@@ -19,33 +19,49 @@ CAPS AutoSync LTS v4.1 (정식 운영 + AutoSync Core + DeployBridge 연동 버
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import atexit
+import contextlib
+import gzip
+import importlib.util
+import io
+import locale
+import os
 import subprocess
-from dataclasses import dataclass
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, Any, ClassVar, List, NamedTuple, Optional, Set, Tuple
+
+from json_io import PRETTY, dumps, loads, load_file, write_atomic
+from log_utils import get_queue_logger
 
 
 AUTOSYNC_VERSION = "4.1.0"
 MODULE_NAME = "AutoSyncLTS"
 
+# state에 보관할 최근 patch 결과 최대 개수
+LAST_RESULTS_MAX = 500
+
 
 # ─────────────────────────────────────────────
 # 데이터 모델
 # ─────────────────────────────────────────────
 
-@dataclass
-class PlanItem:
+class PlanItem(NamedTuple):
     module: str
     action: str
     priority: int
     reason: str
     target_version: Optional[str]
+    parallel_safe: bool = False
 
 
-@dataclass
-class PatchResult:
+class PatchResult(NamedTuple):
     module: str
     action: str
     success: bool
@@ -53,11 +69,91 @@ class PatchResult:
     message: str
 
 
+# ─────────────────────────────────────────────
+# subprocess 출력 처리
+# ─────────────────────────────────────────────
+
+# stdout 요약 글자 수 / 실패 시 로그에 남길 stderr 끝부분 바이트 수
+MESSAGE_MAX_CHARS = 200
+STDERR_TAIL_BYTES = 2048
+
+# 모듈/SafeGuard 실행에 사용할 인터프리터 (PATH 검색 없이 현재 실행 중인 Python 사용)
+PYTHON = sys.executable or "python"
+
+# Windows에서 모듈 실행 시 콘솔 창을 새로 만들지 않도록 한다
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# 자식 프로세스 stdout/stderr 인코딩 (Windows 한글 환경에서는 cp949 등, text=True와 같은 기준)
+OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+
+def _decode_head(data: bytes, limit: int = MESSAGE_MAX_CHARS) -> str:
+    """
+    출력 bytes의 앞부분만 디코딩해 limit 글자로 자른다. (전체 버퍼는 디코딩하지 않음)
+    한 글자는 최대 4바이트이므로 limit*4 바이트면 충분하다.
+    """
+    if not data:
+        return ""
+    head = data[:limit * 4]
+    msg = head.decode(OUTPUT_ENCODING, "replace").strip()
+    if len(msg) > limit or len(data) > len(head):
+        msg = msg[:limit] + "... (생략)"
+    return msg
+
+
+def _decode_tail(data: bytes, size: int = STDERR_TAIL_BYTES) -> str:
+    """
+    stderr는 마지막 부분(예외 메시지)이 중요하므로 끝부분만 디코딩한다.
+    """
+    return data[-size:].decode(OUTPUT_ENCODING, "replace").strip()
+
+
+# ─────────────────────────────────────────────
+# 워커 프로세스 엔트리포인트
+# ─────────────────────────────────────────────
+
+def _invoke_entrypoint(entrypoint: str, args: List[str], search_path: Optional[str]) -> Tuple[int, str]:
+    """
+    워커 프로세스 안에서 "모듈.경로:함수" 형식의 엔트리포인트를 호출한다.
+    모듈은 워커당 한 번만 import 되고, 함수는 CLI main()과 동일하게 sys.argv로 인자를 받는다.
+    반환값: (returncode, stdout)
+    호출이 끝나면 sys.argv / sys.path는 원래대로 되돌린다. (다음 호출에 흘러가지 않도록)
+    """
+    saved_argv = sys.argv
+    saved_path = list(sys.path)
+    if search_path and search_path not in sys.path:
+        sys.path.insert(0, search_path)
+
+    out = io.StringIO()
+    returncode = 0
+    try:
+        mod_name, _, func_name = entrypoint.partition(":")
+        func = getattr(importlib.import_module(mod_name), func_name or "main")
+
+        sys.argv = [mod_name] + list(args)
+        with contextlib.redirect_stdout(out):
+            ret = func()
+        if isinstance(ret, int):
+            returncode = ret
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            returncode = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+    return returncode, out.getvalue()
+
+
 # ─────────────────────────────────────────────
 # AutoSync LTS 본체
 # ─────────────────────────────────────────────
 
 class AutoSyncLTS:
+    # 기본 설정 파일 확인을 마친 config 경로 (프로세스당 경로별로 한 번만 확인)
+    _BOOTSTRAPPED: ClassVar[Set[Path]] = set()
+
     def __init__(self, base_dir: Optional[Path] = None) -> None:
         self.base_dir = base_dir or Path(__file__).resolve().parent
 
@@ -72,6 +168,21 @@ class AutoSyncLTS:
 
         self.config: Dict[str, Any] = {}
         self.state: Dict[str, Any] = {}
+        self._config_mtime: Optional[int] = None
+
+        # 로그는 큐에 넣기만 하고, 파일 기록은 백그라운드 스레드가 처리
+        self._logger = get_queue_logger(self.logs_dir, "autosync_log")
+
+        # entrypoint 모듈 실행용 워커 풀 (run_from_plan 1회 동안만 유지, 끝나면 정리)
+        # → 다음 실행에서는 새 워커가 모듈을 다시 import 하므로 수정된 코드/전역 상태가 남지 않는다
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # parallel_safe 묶음의 entrypoint 항목들이 여러 스레드에서 동시에 풀을 요청하므로 생성/정리는 잠금 안에서
+        self._pool_lock = threading.Lock()
+        atexit.register(self._shutdown_pool)
+
+        # in-process SafeGuard 모듈과 그 캐시 키 (스크립트 경로, 수정 시각)
+        self._safeguard_module: Any = None
+        self._safeguard_key: Optional[Tuple[str, int]] = None
 
         self._ensure_directories()
         self._ensure_default_config()
@@ -87,7 +198,10 @@ class AutoSyncLTS:
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
     def _ensure_default_config(self) -> None:
+        if self.config_path in AutoSyncLTS._BOOTSTRAPPED:
+            return
         if self.config_path.exists():
+            AutoSyncLTS._BOOTSTRAPPED.add(self.config_path)
             return
 
         default_conf = {
@@ -135,63 +249,120 @@ class AutoSyncLTS:
             }
         }
 
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(default_conf, f, indent=2, ensure_ascii=False)
+        self.config_path.write_bytes(dumps(default_conf, pretty=True))
+        AutoSyncLTS._BOOTSTRAPPED.add(self.config_path)
 
     def _load_config(self) -> None:
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            self.config = json.load(f)
+        self._config_mtime = self.config_path.stat().st_mtime_ns
+        self.config = load_file(self.config_path)
+
+    def reload_config(self) -> bool:
+        """
+        설정 파일이 마지막으로 읽은 이후 수정된 경우에만 다시 읽는다.
+        다시 읽었으면 True를 반환한다.
+        실행 도중 설정 파일이 삭제되었으면 기본 설정을 다시 만들고 그것을 읽는다.
+        """
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._log(f"[WARN] 설정 파일 없음 → 기본 설정 재생성: {self.config_path}")
+            AutoSyncLTS._BOOTSTRAPPED.discard(self.config_path)
+            self._ensure_directories()
+            self._ensure_default_config()
+            self._load_config()
+            return True
+        if mtime == self._config_mtime:
+            return False
+        self._load_config()
+        return True
 
     def _load_state(self) -> None:
+        # config에 "state_gzip": true 이면 state를 gzip(.json.gz)으로 저장
+        if self.config.get("state_gzip"):
+            self.state_path = self.state_dir / "autosync_state.json.gz"
+
         if not self.state_path.exists():
             self.state = {
                 "last_run": None,
                 "last_state": None,
                 "last_results": []
             }
+        elif self.state_path.suffix == ".gz":
+            self.state = loads(gzip.decompress(self.state_path.read_bytes()))
         else:
-            with open(self.state_path, "r", encoding="utf-8") as f:
-                self.state = json.load(f)
+            self.state = load_file(self.state_path)
 
     # ─────────────────────────────────────
     # 로깅
     # ─────────────────────────────────────
     def _log(self, msg: str) -> None:
-        now = datetime.now()
-        date_str = now.strftime("%Y%m%d")
-        log_path = self.logs_dir / f"autosync_log_{date_str}.txt"
-        line = f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {msg}\n"
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(line)
-        print(line, end="")
+        self._logger.info(msg)
+
+    # ─────────────────────────────────────
+    # 워커 풀
+    # ─────────────────────────────────────
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+            return self._pool
+
+    def _shutdown_pool(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _call_entrypoint(self, entrypoint: str, args: List[str], script: Optional[str]) -> Tuple[int, str]:
+        """
+        워커 풀에서 엔트리포인트를 실행하고 결과를 기다린다.
+        script가 지정되어 있으면 그 폴더를 import 경로에 추가한다.
+        """
+        search_path = str(Path(script).parent) if script else None
+        future = self._get_pool().submit(_invoke_entrypoint, entrypoint, args, search_path)
+        return future.result()
 
     # ─────────────────────────────────────
     # Core plan 읽기
     # ─────────────────────────────────────
-    def _load_plan(self) -> List[PlanItem]:
+    def _load_plan(self) -> Tuple[List[PlanItem], List[PlanItem], List[PlanItem]]:
+        """
+        plan을 읽어 (PATCH 항목, CHECK_ONLY 항목, 알 수 없는 action 항목)으로 나눈다.
+        PATCH 항목만 우선순위 순으로 정렬한다.
+        """
         plan_path = Path(self.config["caps_core_plan"])
         if not plan_path.exists():
             self._log(f"[ERROR] caps_core_plan.json 없음: {plan_path}")
-            return []
-
-        with open(plan_path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-
-        items = []
-        for it in raw.get("items", []):
-            items.append(
-                PlanItem(
-                    module=it.get("module", ""),
-                    action=it.get("action", ""),
-                    priority=int(it.get("priority", 999)),
-                    reason=it.get("reason", ""),
-                    target_version=it.get("target_version")
-                )
-            )
+            return [], [], []
+
+        raw = load_file(plan_path)
+
+        items = [
+            PlanItem._make((
+                it.get("module", ""),
+                it.get("action", ""),
+                int(it.get("priority", 999)),
+                it.get("reason", ""),
+                it.get("target_version"),
+                bool(it.get("parallel_safe", False))
+            ))
+            for it in raw.get("items", [])
+        ]
+
+        patch_items: List[PlanItem] = []
+        check_items: List[PlanItem] = []
+        unknown_items: List[PlanItem] = []
+        for item in items:
+            if item.action == "PATCH":
+                patch_items.append(item)
+            elif item.action == "CHECK_ONLY":
+                check_items.append(item)
+            else:
+                unknown_items.append(item)
 
-        # 우선순위 순 정렬
-        items.sort(key=lambda x: x.priority)
-        return items
+        # 우선순위 순 정렬 (안정 정렬이므로 같은 priority는 plan 순서 유지)
+        patch_items.sort(key=attrgetter("priority"))
+        return patch_items, check_items, unknown_items
 
     # ─────────────────────────────────────
     # 모듈 패치 실행
@@ -224,6 +395,11 @@ class AutoSyncLTS:
         script = mod_conf.get("script")
         args = mod_conf.get("args", [])
 
+        # entrypoint가 지정된 모듈은 워커 풀에서 실행 (인터프리터 재기동 없음)
+        entrypoint = mod_conf.get("entrypoint")
+        if entrypoint:
+            return self._run_entrypoint_for_module(item, entrypoint, args, script)
+
         if not script or not Path(script).exists():
             msg = f"스크립트 경로 없음: {script}"
             self._log(f"[ERROR] {msg}")
@@ -235,35 +411,132 @@ class AutoSyncLTS:
                 message=msg
             )
 
-        cmd = ["python", script] + args
+        cmd = [PYTHON, script] + args
 
         self._log(f"[INFO] 모듈 실행 시작: {item.module} | action={item.action} | cmd={' '.join(cmd)}")
         try:
             proc = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
-                shell=False
+                creationflags=CREATION_FLAGS
+            )
+            return self._patch_result_from_output(item, proc.returncode, proc.stdout, proc.stderr)
+        except Exception as e:
+            msg = f"예외 발생: {e}"
+            self._log(f"[ERROR] {msg}")
+            return PatchResult(
+                module=item.module,
+                action=item.action,
+                success=False,
+                returncode=-1,
+                message=msg
             )
-            success = (proc.returncode == 0)
-            if success:
-                self._log(f"[OK] 모듈 실행 성공: {item.module}")
-            else:
-                self._log(f"[FAIL] 모듈 실행 실패: {item.module} | returncode={proc.returncode}")
-                if proc.stderr:
-                    self._log(f"[STDERR] {proc.stderr.strip()}")
 
-            msg = (proc.stdout or "").strip()
-            if len(msg) > 200:
-                msg = msg[:200] + "... (생략)"
+    def _patch_result_from_output(self, item: PlanItem, returncode: int, stdout: bytes, stderr: bytes) -> PatchResult:
+        success = (returncode == 0)
+        if success:
+            self._log(f"[OK] 모듈 실행 성공: {item.module}")
+        else:
+            self._log(f"[FAIL] 모듈 실행 실패: {item.module} | returncode={returncode}")
+            if stderr:
+                self._log(f"[STDERR] {_decode_tail(stderr)}")
+
+        msg = _decode_head(stdout)
+
+        return PatchResult(
+            module=item.module,
+            action=item.action,
+            success=success,
+            returncode=returncode,
+            message=msg
+        )
+
+    def _load_safeguard(self, sg_script: str) -> Any:
+        """
+        SafeGuard 스크립트를 모듈로 import 해서 SafeGuardLTS 인스턴스를 만든다.
+        모듈은 (스크립트 경로, 수정 시각)이 바뀔 때만 다시 import 하고,
+        인스턴스는 검사마다 새로 만든다. (safeguard_config.json을 매번 다시 읽도록)
+        import 할 수 없으면 None을 반환하고, 호출 측은 subprocess 방식으로 실행한다.
+        실패는 캐시하지 않으므로 다음 검사에서 다시 시도한다.
+        """
+        try:
+            key = (sg_script, os.stat(sg_script).st_mtime_ns)
+        except OSError as e:
+            self._log(f"[WARN] SafeGuard 스크립트 확인 실패 → subprocess로 실행: {e}")
+            return None
+
+        if key != self._safeguard_key:
+            self._safeguard_module = None
+            self._safeguard_key = None
+            try:
+                spec = importlib.util.spec_from_file_location("SGD_safe_guard_lts", sg_script)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+            except Exception as e:
+                self._log(f"[WARN] SafeGuard in-process 로드 실패 → subprocess로 실행: {e}")
+                return None
+            self._safeguard_module = module
+            self._safeguard_key = key
 
+        try:
+            return self._safeguard_module.SafeGuardLTS()
+        except Exception as e:
+            self._log(f"[WARN] SafeGuard 인스턴스 생성 실패 → subprocess로 실행: {e}")
+            return None
+
+    def _run_entrypoint_for_module(self, item: PlanItem, entrypoint: str, args: List[str], script: Optional[str]) -> PatchResult:
+        self._log(f"[INFO] 모듈 실행 시작: {item.module} | action={item.action} | entrypoint={entrypoint}")
+        try:
+            returncode, stdout = self._call_entrypoint(entrypoint, args, script)
+        except Exception as e:
+            msg = f"예외 발생: {e}"
+            self._log(f"[ERROR] {msg}")
             return PatchResult(
                 module=item.module,
                 action=item.action,
-                success=success,
-                returncode=proc.returncode,
+                success=False,
+                returncode=-1,
                 message=msg
             )
+
+        success = (returncode == 0)
+        if success:
+            self._log(f"[OK] 모듈 실행 성공: {item.module}")
+        else:
+            self._log(f"[FAIL] 모듈 실행 실패: {item.module} | returncode={returncode}")
+
+        msg = stdout.strip()
+        if len(msg) > MESSAGE_MAX_CHARS:
+            msg = msg[:MESSAGE_MAX_CHARS] + "... (생략)"
+
+        return PatchResult(
+            module=item.module,
+            action=item.action,
+            success=success,
+            returncode=returncode,
+            message=msg
+        )
+
+    async def _run_patch_async(self, item: PlanItem) -> PatchResult:
+        mod_conf = self.config.get("modules", {}).get(item.module) or {}
+        script = mod_conf.get("script")
+        args = mod_conf.get("args", [])
+
+        # 스크립트 실행 대상이 아니면(자기 자신/설정 오류/entrypoint) 동기 경로를 스레드에서 처리
+        if item.module == "AutoSync" or mod_conf.get("entrypoint") or not script or not Path(script).exists():
+            return await asyncio.to_thread(self._run_patch_for_module, item)
+
+        cmd = [PYTHON, script] + args
+
+        self._log(f"[INFO] 모듈 실행 시작: {item.module} | action={item.action} | cmd={' '.join(cmd)}")
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                creationflags=CREATION_FLAGS
+            )
+            stdout, stderr = await proc.communicate()
         except Exception as e:
             msg = f"예외 발생: {e}"
             self._log(f"[ERROR] {msg}")
@@ -275,47 +548,90 @@ class AutoSyncLTS:
                 message=msg
             )
 
+        return self._patch_result_from_output(item, proc.returncode, stdout, stderr)
+
+    async def _gather_patches(self, items: List[PlanItem]) -> List[PatchResult]:
+        return await asyncio.gather(*(self._run_patch_async(it) for it in items))
+
+    def _run_patch_parallel(self, items: List[PlanItem]) -> List[PatchResult]:
+        """
+        plan 순서상 연속된 parallel_safe 항목들을 동시에 실행한다.
+        (asyncio 서브프로세스로 한꺼번에 띄우고 gather, 결과는 plan 순서대로 반환)
+        """
+        if len(items) == 1:
+            return [self._run_patch_for_module(items[0])]
+        return list(asyncio.run(self._gather_patches(items)))
+
     # ─────────────────────────────────────
     # 전체 실행 (LTS 플로우)
     # ─────────────────────────────────────
     def run_from_plan(self, dry_run: bool = False) -> Dict[str, Any]:
         self._log(f"[INFO] AutoSync LTS v{AUTOSYNC_VERSION} 실행 시작 (dry_run={dry_run})")
 
-        plan_items = self._load_plan()
-        if not plan_items:
+        patch_items, check_items, unknown_items = self._load_plan()
+        if not (patch_items or check_items or unknown_items):
             self._log("[WARN] Plan 항목이 없습니다. 종료.")
             return {"state": "NO_PLAN", "results": []}
 
-        patch_results: List[PatchResult] = []
+        # CHECK_ONLY / 알 수 없는 action은 한 줄로 모아서 로그만 남기고 스킵
+        if check_items:
+            self._log(f"[INFO] CHECK_ONLY → 모듈 실행 스킵: {', '.join(i.module for i in check_items)}")
+        if unknown_items:
+            skipped = ", ".join(f"{i.module}({i.action})" for i in unknown_items)
+            self._log(f"[INFO] 알 수 없는 action → 스킵: {skipped}")
 
-        for item in plan_items:
-            # CHECK_ONLY는 일단 로그만 남기고 스킵
-            if item.action == "CHECK_ONLY":
-                self._log(f"[INFO] CHECK_ONLY → 모듈 실행 스킵: {item.module}")
-                continue
+        patch_results: List[PatchResult] = []
 
-            if item.action == "PATCH":
-                if dry_run:
-                    self._log(f"[DRY-RUN] PATCH 대상: {item.module} (실행 안 함)")
+        if dry_run:
+            if patch_items:
+                self._log(f"[DRY-RUN] PATCH 대상: {', '.join(i.module for i in patch_items)} (실행 안 함)")
+        else:
+            # 우선순위 순서(plan 순서)를 유지한 채, 연속된 parallel_safe 항목 묶음만 동시에 실행
+            # (CAPS Core는 모듈마다 priority가 달라서 같은 priority로 묶으면 묶음이 항상 1개가 된다)
+            # 플래그 없는 항목은 하나씩 순차 실행하며, 묶음 사이의 경계 역할을 한다
+            for is_parallel, run in groupby(patch_items, key=attrgetter("parallel_safe")):
+                if is_parallel:
+                    patch_results.extend(self._run_patch_parallel(list(run)))
                     continue
-                res = self._run_patch_for_module(item)
-                patch_results.append(res)
-            else:
-                self._log(f"[INFO] 알 수 없는 action={item.action} → 스킵")
+                for item in run:
+                    patch_results.append(self._run_patch_for_module(item))
 
         # SafeGuard 최종 검증
         overall_state = "UNKNOWN"
         if not dry_run:
             sg_script = self.config.get("safeguard_script")
-            if sg_script and Path(sg_script).exists():
-                cmd = ["python", sg_script, "--check"]
+            sg_entrypoint = self.config.get("safeguard_entrypoint")
+
+            # 기본은 SafeGuardLTS를 직접 import 해서 같은 프로세스에서 검사 ("safeguard_inprocess": false 이면 subprocess)
+            safeguard = None
+            if not sg_entrypoint and sg_script and Path(sg_script).exists() and self.config.get("safeguard_inprocess", True):
+                safeguard = self._load_safeguard(sg_script)
+
+            if sg_entrypoint:
+                self._log(f"[INFO] SafeGuard LTS 최종 검사 실행: entrypoint={sg_entrypoint}")
+                try:
+                    returncode, _ = self._call_entrypoint(sg_entrypoint, ["--check"], sg_script)
+                    overall_state = "GREEN" if returncode == 0 else "RED"
+                    self._log(f"[RESULT] SafeGuard 최종 상태: {overall_state}")
+                except Exception as e:
+                    overall_state = "ERROR"
+                    self._log(f"[ERROR] SafeGuard 실행 예외: {e}")
+            elif safeguard is not None:
+                self._log("[INFO] SafeGuard LTS 최종 검사 실행: in-process run_full_check()")
+                try:
+                    overall_state = safeguard.run_full_check().get("state", "RED")
+                    self._log(f"[RESULT] SafeGuard 최종 상태: {overall_state}")
+                except Exception as e:
+                    overall_state = "ERROR"
+                    self._log(f"[ERROR] SafeGuard 실행 예외: {e}")
+            elif sg_script and Path(sg_script).exists():
+                cmd = [PYTHON, sg_script, "--check"]
                 self._log(f"[INFO] SafeGuard LTS 최종 검사 실행: {' '.join(cmd)}")
                 try:
                     proc = subprocess.run(
                         cmd,
                         capture_output=True,
-                        text=True,
-                        shell=False
+                        creationflags=CREATION_FLAGS
                     )
                     if proc.returncode == 0:
                         overall_state = "GREEN"
@@ -324,7 +640,7 @@ class AutoSyncLTS:
                         overall_state = "RED"
                         self._log("[RESULT] SafeGuard 최종 상태: RED")
                         if proc.stderr:
-                            self._log(f"[SafeGuard STDERR] {proc.stderr.strip()}")
+                            self._log(f"[SafeGuard STDERR] {_decode_tail(proc.stderr)}")
                 except Exception as e:
                     overall_state = "ERROR"
                     self._log(f"[ERROR] SafeGuard 실행 예외: {e}")
@@ -332,11 +648,14 @@ class AutoSyncLTS:
                 overall_state = "NO_SAFEGUARD"
                 self._log("[WARN] SafeGuard 스크립트 설정/경로가 올바르지 않습니다.")
 
+        # 이번 실행에서 쓴 워커 풀 정리 (워커에 import 된 모듈/전역 상태를 다음 실행으로 넘기지 않음)
+        self._shutdown_pool()
+
         # state 저장
         result_dict = {
             "state": overall_state,
             "run_at": datetime.now().isoformat(timespec="seconds"),
-            "patch_results": [pr.__dict__ for pr in patch_results],
+            "patch_results": [pr._asdict() for pr in patch_results],
             "dry_run": dry_run
         }
         self._save_state(result_dict)
@@ -350,10 +669,15 @@ class AutoSyncLTS:
     def _save_state(self, result: Dict[str, Any]) -> None:
         self.state["last_run"] = result["run_at"]
         self.state["last_state"] = result["state"]
-        self.state["last_results"] = result["patch_results"]
+        # 최근 LAST_RESULTS_MAX 개만 유지 (state 파일이 무한히 커지지 않도록)
+        history = self.state.get("last_results", []) + result["patch_results"]
+        self.state["last_results"] = history[-LAST_RESULTS_MAX:]
 
-        with open(self.state_path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        if self.state_path.suffix == ".gz":
+            data = gzip.compress(dumps(self.state), compresslevel=1)
+        else:
+            data = dumps(self.state, pretty=PRETTY)
+        write_atomic(self.state_path, data)
 
     # ─────────────────────────────────────
     # 요약 출력
@@ -364,7 +688,7 @@ class AutoSyncLTS:
         print(f"- safeguard_script: {self.config['safeguard_script']}")
         print(f"- modules:")
         for name, conf in self.config.get("modules", {}).items():
-            print(f"  - {name:15s} → {conf.get('script')}")
+            print(f"  - {name:15s} → {conf.get('entrypoint') or conf.get('script')}")
         print(f"- state_path     : {self.state_path}")
         print()
 
@@ -11,14 +11,15 @@ CAPS AutoSync 3.0 - 진화 제안(Sandbox) + 통합 상태 관리
 6) AutoSync v3.0 state/report JSON 생성.
 """
 
-import json
-import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import List
 
-from AS_watcher_v1_5 import load_rules, build_snapshot
+from AS_io_cache import PRETTY, load_json, save_json_batch, save_json_compact
+from AS_core import detect_changes, compute_snapshot_hash
+from log_utils import now_str
+from AS_watcher_v1_5 import load_rules, build_snapshots
 from AS_processor_v2_0 import process_changed_files
 from AS_integrity_v2_5 import run_integrity_check
 from AS_evolver_v3_0 import generate_proposals
@@ -38,52 +39,7 @@ SAFEGUARD_STATE = BASE_DIR.parent / "SafeGuard" / "SGD_state.json"
 
 
 def safe_print(msg: str) -> None:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[AS] {ts} | {msg}")
-
-
-def load_json(path: Path, default=None):
-    if default is None:
-        default = {}
-    if path.exists():
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return default
-    return default
-
-
-def save_json(path: Path, data: dict) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def detect_changes(old: Dict[str, float], new: Dict[str, float]) -> Dict[str, List[str]]:
-    added, modified, deleted = [], [], []
-
-    old_keys = set(old.keys())
-    new_keys = set(new.keys())
-
-    for k in new_keys - old_keys:
-        added.append(k)
-    for k in old_keys - new_keys:
-        deleted.append(k)
-    for k in old_keys & new_keys:
-        if old[k] != new[k]:
-            modified.append(k)
-
-    return {
-        "added": sorted(added),
-        "modified": sorted(modified),
-        "deleted": sorted(deleted),
-    }
-
-
-def compute_snapshot_hash(files: Dict[str, float]) -> str:
-    items = [f"{p}:{m}" for p, m in sorted(files.items())]
-    data = "\n".join(items).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
+    print(f"[AS] {now_str()} | {msg}")
 
 
 def main():
@@ -102,7 +58,7 @@ def main():
         return
 
     # 2) 스냅샷 생성
-    snapshot: Dict[str, float] = {}
+    roots: List[Path] = []
     scanned_paths: List[str] = []
 
     for rel in watch_paths:
@@ -111,10 +67,10 @@ def main():
             safe_print(f"Skip (not found): {root}")
             continue
         scanned_paths.append(str(root))
-        snap = build_snapshot(root, rules)
-        prefix = root.name
-        for path, mtime in snap.items():
-            snapshot[f"{prefix}/{path}"] = mtime
+        roots.append(root)
+
+    # 루트별 스캔은 스레드 풀에서 동시에 실행, "<폴더명>/<상대경로>" 키로 합침
+    snapshot = build_snapshots(roots, rules)
 
     # 3) 이전 상태(v2.5) 로드 + 변경 감지
     prev_state = load_json(STATE_FILE_V25, default={"files": {}, "modules": {}})
@@ -135,9 +91,10 @@ def main():
     generated_files = proposals_result.get("generated_files", [])
 
     # 7) SafeGuard에 risk_score 반영 (기존 필드 유지 + autosync_risk 업데이트)
-    sg_state = load_json(SAFEGUARD_STATE, default={})
+    # 캐시된 객체를 수정하지 않도록 복사본에 반영
+    sg_state = dict(load_json(SAFEGUARD_STATE, default={}))
     sg_state["autosync_risk"] = risk_score
-    save_json(SAFEGUARD_STATE, sg_state)
+    save_json_compact(SAFEGUARD_STATE, sg_state)
 
     # 8) 새 state/report 저장 (v3.0)
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -149,7 +106,8 @@ def main():
         "snapshot_hash": snapshot_hash,
         "file_count": len(snapshot),
         "modules": prev_state.get("modules", {}),
-        "files": snapshot,
+        # 전체 파일 목록(files)은 저장하지 않음 (v3.0 state의 files를 읽는 곳이 없음) → 이번 변경분만 기록
+        "changes": changes,
         "auto_actions": auto_actions,
         "issues": issues,
         "risk_score": risk_score,
@@ -157,7 +115,6 @@ def main():
         "proposals_count": len(proposals),
         "generated_files": generated_files,
     }
-    save_json(STATE_FILE_V30, new_state)
 
     new_report = {
         "version": "3.0",
@@ -176,7 +133,7 @@ def main():
         "proposals": proposals,
         "proposals_generated_files": generated_files,
     }
-    save_json(REPORT_FILE_V30, new_report)
+    save_json_batch([(STATE_FILE_V30, new_state, PRETTY), (REPORT_FILE_V30, new_report, True)])
 
     # 9) 로그 출력
     safe_print(f"Added      : {len(changes['added'])}")
@@ -15,11 +15,13 @@ AutoSync 3.1 - 노마드 명령 인식 + 명령 계획 생성 (Sandbox, No-Code-
 
 from __future__ import annotations
 
-import json
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
 
+from AS_io_cache import PRETTY, load_json, save_json, save_json_batch, save_json_compact
+from log_utils import now_str
 from AS_command_intent_v3_1 import analyze_command
 
 
@@ -32,23 +34,7 @@ PLAN_FILE = GENERATED_DIR / "AS_command_plan_v3_1.json"
 
 
 def safe_print(msg: str) -> None:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[AS] {ts} | {msg}")
-
-
-def load_json(path: Path, default: Any) -> Any:
-    if path.exists():
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return default
-    return default
-
-
-def save_json(path: Path, data: Any) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"[AS] {now_str()} | {msg}")
 
 
 def ensure_default_commands_file() -> None:
@@ -107,7 +93,7 @@ def main():
         "command_count": len(analyzed),
         "intents": analyzed,
     }
-    save_json(PLAN_FILE, plan)
+    save_json_compact(PLAN_FILE, plan)
 
     # 4) 상태/리포트 파일 생성
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -117,17 +103,11 @@ def main():
         "last_run": now,
         "command_count": len(analyzed),
         "pending": sum(1 for i in analyzed if i.get("status") == "pending"),
-        "by_intent_type": {},
-        "by_module": {},
+        # intent 통계
+        "by_intent_type": dict(Counter(i.get("intent_type", "unknown") for i in analyzed)),
+        "by_module": dict(Counter(i.get("target_module", "Unknown") for i in analyzed)),
     }
 
-    # intent 통계
-    for item in analyzed:
-        itype = item.get("intent_type", "unknown")
-        mod = item.get("target_module", "Unknown")
-        state["by_intent_type"][itype] = state["by_intent_type"].get(etype := itype, 0) + 1
-        state["by_module"][mod] = state["by_module"].get(mod, 0) + 1
-
     report = {
         "version": "3.1",
         "generated_at": now,
@@ -139,8 +119,7 @@ def main():
         "plan_file": str(PLAN_FILE),
     }
 
-    save_json(STATE_FILE, state)
-    save_json(REPORT_FILE, report)
+    save_json_batch([(STATE_FILE, state, PRETTY), (REPORT_FILE, report, True)])
 
     safe_print(f"Commands : {len(analyzed)}")
     safe_print(f"Pending  : {state['pending']}")
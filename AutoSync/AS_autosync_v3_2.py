@@ -14,12 +14,15 @@ AutoSync 3.2 - Self-Healing 1단계 + 명령 분석 + 무결성
 이 단계는 파일(.py) 코드를 절대 수정하지 않는다.
 """
 
-import time, json, hashlib
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import List
 
-from AS_watcher_v1_5 import load_rules, build_snapshot
+from AS_io_cache import PRETTY, load_json, save_json_batch
+from AS_core import detect_changes, compute_snapshot_hash
+from log_utils import now_str
+from AS_watcher_v1_5 import load_rules, build_snapshots
 from AS_processor_v2_0 import process_changed_files
 from AS_integrity_v2_5 import run_integrity_check
 from AS_healer_v3_2 import run_healer
@@ -36,48 +39,7 @@ COMMAND_PLAN = BASE_DIR / "generated" / "AS_command_plan_v3_1.json"
 
 
 def safe_print(msg):
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[AS] {ts} | {msg}")
-
-
-def load_json(path, default=None):
-    if default is None:
-        default = {}
-    try:
-        if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-    except:
-        return default
-    return default
-
-
-def save_json(path: Path, data):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def detect_changes(old: Dict[str, float], new: Dict[str, float]):
-    added, modified, deleted = [], [], []
-    oldk, newk = set(old.keys()), set(new.keys())
-
-    added.extend(newk - oldk)
-    deleted.extend(oldk - newk)
-    for k in oldk & newk:
-        if old[k] != new[k]:
-            modified.append(k)
-
-    return {
-        "added": sorted(added),
-        "modified": sorted(modified),
-        "deleted": sorted(deleted),
-    }
-
-
-def compute_snapshot_hash(files: Dict[str, float]):
-    items = [f"{p}:{m}" for p, m in sorted(files.items())]
-    data = "\n".join(items).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
+    print(f"[AS] {now_str()} | {msg}")
 
 
 def main():
@@ -91,7 +53,7 @@ def main():
     rules = load_rules(RULE_FILE)
 
     # 2) snapshot
-    snapshot: Dict[str, float] = {}
+    roots: List[Path] = []
     scanned = []
 
     for rel in rules.get("watch_paths", []):
@@ -99,14 +61,19 @@ def main():
         if not root.exists():
             continue
         scanned.append(str(root))
-        snap = build_snapshot(root, rules)
-        prefix = root.name
-        for p, m in snap.items():
-            snapshot[f"{prefix}/{p}"] = m
+        roots.append(root)
+
+    # 루트별 스캔은 스레드 풀에서 동시에 실행, "<폴더명>/<상대경로>" 키로 합침
+    snapshot = build_snapshots(roots, rules)
 
     # 이전 상태가 없으면 빈 dict
     prev_state = load_json(STATE_FILE_V32, default={"files": {}})
-    changes = detect_changes(prev_state.get("files", {}), snapshot)
+    # 지문이 이전 실행과 같으면 변경 없음 → 집합 비교(detect_changes) 생략
+    prev_hash = prev_state.get("snapshot_hash")
+    if prev_hash and compute_snapshot_hash(snapshot) == prev_hash:
+        changes = {"added": [], "modified": [], "deleted": []}
+    else:
+        changes = detect_changes(prev_state.get("files", {}), snapshot)
 
     # 3) v2.0 processor (JSON 정규화)
     auto_actions, processor_issues = process_changed_files(BASE_DIR.parent, changes)
@@ -143,8 +110,6 @@ def main():
         "changes": changes,
     }
 
-    save_json(STATE_FILE_V32, new_state)
-
     new_report = {
         "version": "3.2",
         "generated_at": now,
@@ -160,7 +125,7 @@ def main():
         "command_intents": command_plan.get("intents", []),
     }
 
-    save_json(REPORT_FILE_V32, new_report)
+    save_json_batch([(STATE_FILE_V32, new_state, PRETTY), (REPORT_FILE_V32, new_report, True)])
 
     safe_print(f"Added      : {len(changes['added'])}")
     safe_print(f"Modified   : {len(changes['modified'])}")
@@ -10,13 +10,16 @@ AutoSync 3.5 - 명령 기반 코드 생성/부분 자동 수정 (안전 모드)
 5) state/report 저장
 """
 
-import time, json, hashlib
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import List
 
-from AS_watcher_v1_5 import build_snapshot, load_rules
-from AS_patch_engine_v3_5 import process_intent, safe_print, PATCH_DIR
+from AS_io_cache import PRETTY, load_json, save_json_batch
+from AS_core import compute_file_hash, compute_snapshot_hash
+from AS_intent_pool import map_intents
+from AS_watcher_v1_5 import build_snapshots, load_rules
+from AS_patch_engine_v3_5 import process_intent, intent_resource_key, safe_print, PATCH_DIR
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -28,29 +31,6 @@ REPORT_FILE = BASE_DIR / "AS_report_v3_5.json"
 COMMAND_PLAN = BASE_DIR / "generated" / "AS_command_plan_v3_1.json"
 
 
-def load_json(path, default=None):
-    if default is None:
-        default = {}
-    try:
-        if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-    except:
-        return default
-    return default
-
-
-def save_json(path: Path, data):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def compute_snapshot_hash(files: Dict[str, float]):
-    items = [f"{p}:{m}" for p, m in sorted(files.items())]
-    data = "\n".join(items).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
-
-
 def main():
     start = time.time()
     safe_print("AutoSync v3.5 (Code Patch Mode) started.")
@@ -59,15 +39,15 @@ def main():
     rules = load_rules(RULE_FILE)
 
     # 2) snapshot
-    snapshot = {}
+    roots: List[Path] = []
     for rel in rules.get("watch_paths", []):
         root = (BASE_DIR / rel).resolve()
         if not root.exists():
             continue
-        snap = build_snapshot(root, rules)
-        prefix = root.name
-        for p, m in snap.items():
-            snapshot[f"{prefix}/{p}"] = m
+        roots.append(root)
+
+    # 루트별 스캔은 스레드 풀에서 동시에 실행, "<폴더명>/<상대경로>" 키로 합침
+    snapshot = build_snapshots(roots, rules)
 
     # 3) command plan 로드
     plan = load_json(COMMAND_PLAN, default={"intents": []})
@@ -76,26 +56,34 @@ def main():
     patches = []
     generated_files = []
 
-    for intent in intents:
-        result = process_intent(intent)
-        patches.extend(result.get("patches", []))
-        generated_files.extend(result.get("generated", []))
+    # 계획 파일이 지난 실행과 같으면 intent 처리를 건너뛰고 이전 결과를 그대로 사용
+    plan_hash = compute_file_hash(COMMAND_PLAN)
+    prev_state = load_json(STATE_FILE, default={})
+    if plan_hash and prev_state.get("plan_hash") == plan_hash:
+        safe_print("Plan unchanged; reusing previous results.")
+        patches.extend(prev_state.get("patches", []))
+        generated_files.extend(prev_state.get("generated_files", []))
+    else:
+        # 서로 다른 파일을 건드리는 intent끼리는 프로세스 풀에서 병렬 처리
+        for result in map_intents(process_intent, intents, key=intent_resource_key):
+            patches.extend(result.get("patches", []))
+            generated_files.extend(result.get("generated", []))
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # 4) 상태 저장
+    # 4) 상태
     state = {
         "version": "3.5",
         "last_run": now,
         "snapshot_hash": compute_snapshot_hash(snapshot),
         "intent_count": len(intents),
+        "plan_hash": plan_hash,
         "patches": patches,
         "generated_files": generated_files,
         "patch_dir": str(PATCH_DIR),
     }
-    save_json(STATE_FILE, state)
 
-    # 5) 리포트 저장
+    # 5) 리포트 → state/report 한 번에 저장
     report = {
         "version": "3.5",
         "generated_at": now,
@@ -107,7 +95,7 @@ def main():
         "patches": patches,
         "generated_files": generated_files,
     }
-    save_json(REPORT_FILE, report)
+    save_json_batch([(STATE_FILE, state, PRETTY), (REPORT_FILE, report, True)])
 
     safe_print(f"Intents   : {len(intents)}")
     safe_print(f"Patches   : {len(patches)}")
@@ -12,11 +12,11 @@ AutoSync 3.7 - Patch Safety Validation Mode
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, List
 
+from AS_io_cache import PRETTY, load_json, save_json_batch
 from AS_patch_guard_v3_7 import guard_files, safe_print
 
 
@@ -27,21 +27,6 @@ STATE_V37 = BASE_DIR / "AS_state_v3_7.json"
 REPORT_V37 = BASE_DIR / "AS_report_v3_7.json"
 
 
-def load_json(path: Path, default: Any) -> Any:
-    if path.exists():
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return default
-    return default
-
-
-def save_json(path: Path, data: Any) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
 def main():
     safe_print("AutoSync v3.7 (Patch Safety Validation) started.")
 
@@ -66,7 +51,7 @@ def main():
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # 3) state_v3_7 저장
+    # 3) state_v3_7
     state_v37: Dict[str, Any] = {
         "version": "3.7",
         "last_run": now,
@@ -74,13 +59,21 @@ def main():
         "validation_summary": results.get("summary", {}),
         "validation_results": results.get("results", []),
     }
-    save_json(STATE_V37, state_v37)
 
-    # 4) report_v3_7 저장
+    # 4) report_v3_7 → state/report 한 번에 저장
     report_v37: Dict[str, Any] = {
         "version": "3.7",
         "generated_at": now,
         "summary": results.get("summary", {}),
         "details": results.get("results", []),
     }
-    save
+    save_json_batch([(STATE_V37, state_v37, PRETTY), (REPORT_V37, report_v37, True)])
+
+    summary = results.get("summary", {})
+    safe_print(f"Validated : {summary.get('total', 0)}")
+    safe_print(f"Safe/Warn/Block : {summary.get('safe', 0)}/{summary.get('warn', 0)}/{summary.get('block', 0)}")
+    safe_print("AutoSync v3.7 finished.")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,15 @@ AutoSync 4.0 - Full Autonomous Patch Engine
 
 from __future__ import annotations
 
-import json, time, hashlib
+import time, hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
-from AS_patch_engine_v4_0 import full_patch, safe_print
+from AS_io_cache import PRETTY, load_json, save_json_batch
+from AS_core import compute_file_hash
+from AS_intent_pool import map_intents
+from AS_patch_engine_v4_0 import full_patch, intent_resource_key, safe_print
 
 
 BASE = Path(__file__).resolve().parent
@@ -25,23 +28,6 @@ STATE = BASE / "AS_state_v4_0.json"
 REPORT = BASE / "AS_report_v4_0.json"
 
 
-def load_json(path, default=None):
-    if default is None:
-        default = {}
-    try:
-        if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-    except:
-        return default
-    return default
-
-
-def save_json(path, data):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
 def compute_hash():
     h = hashlib.sha256(str(time.time()).encode()).hexdigest()
     return h[:16]
@@ -57,16 +43,26 @@ def main():
     blocked = []
     skipped = []
 
-    for intent in intents:
-        result = full_patch(intent)
-        status = result.get("status")
-
-        if status == "APPLIED":
-            applied.append(result)
-        elif status == "BLOCK":
-            blocked.append(result)
-        else:
-            skipped.append(result)
+    # 계획 파일이 지난 실행과 같으면 패치를 다시 돌리지 않고 이전 결과를 그대로 사용
+    # (full_patch는 함수 덧붙이기처럼 반복 적용 시 결과가 누적되는 패치도 포함)
+    plan_hash = compute_file_hash(PLAN)
+    prev_state = load_json(STATE, default={})
+    if plan_hash and prev_state.get("plan_hash") == plan_hash:
+        safe_print("Plan unchanged; reusing previous results.")
+        applied.extend(prev_state.get("applied", []))
+        blocked.extend(prev_state.get("blocked", []))
+        skipped.extend(prev_state.get("skipped", []))
+    else:
+        # 서로 다른 대상 파일을 패치하는 intent끼리는 프로세스 풀에서 병렬 처리
+        for result in map_intents(full_patch, intents, key=intent_resource_key):
+            status = result.get("status")
+
+            if status == "APPLIED":
+                applied.append(result)
+            elif status == "BLOCK":
+                blocked.append(result)
+            else:
+                skipped.append(result)
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -74,6 +70,7 @@ def main():
         "version": "4.0",
         "last_run": now,
         "hash": compute_hash(),
+        "plan_hash": plan_hash,
         "applied_count": len(applied),
         "blocked_count": len(blocked),
         "skipped_count": len(skipped),
@@ -81,7 +78,6 @@ def main():
         "blocked": blocked,
         "skipped": skipped,
     }
-    save_json(STATE, state)
 
     report = {
         "version": "4.0",
@@ -97,7 +93,7 @@ def main():
             "skipped": skipped,
         }
     }
-    save_json(REPORT, report)
+    save_json_batch([(STATE, state, PRETTY), (REPORT, report, True)])
 
     safe_print(f"Applied patches : {len(applied)}")
     safe_print(f"Blocked patches : {len(blocked)}")
@@ -10,6 +10,7 @@ AutoSync 3.1 - 노마드 명령 의도 분석 엔진 (Command Intent Layer)
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, asdict
 from typing import Optional, Dict
 
@@ -24,50 +25,72 @@ class CommandIntent:
     notes: str = ""
 
 
-def _detect_module(text: str) -> str:
-    t = text.lower()
+# ─────────────────────────────
+# 키워드 테이블 (위에 있을수록 우선순위가 높음)
+# ─────────────────────────────
+MODULE_KEYWORDS = (
+    ("OmegaEngine", ("omega", "오메가")),
+    ("Scheduler", ("스케줄러", "scheduler")),
+    ("SafeGuard", ("세이프가드", "safeguard")),
+    ("AutoSync", ("오토싱크", "autosync")),
+    ("GLOBAL", ("전체", "캡스", "caps")),
+)
 
-    if "omega" in t or "오메가" in t:
-        return "OmegaEngine"
-    if "스케줄러" in t or "scheduler" in t:
-        return "Scheduler"
-    if "세이프가드" in t or "safeguard" in t:
-        return "SafeGuard"
-    if "오토싱크" in t or "autosync" in t or "autosync" in t:
-        return "AutoSync"
-    if "전체" in t or "캡스" in t or "caps" in t:
-        return "GLOBAL"
+INTENT_KEYWORDS = (
+    # 기능 생성 / 추가
+    ("create_feature", ("기능", "feature", "새로", "만들어줘", "만들어", "추가해줘", "추가해")),
+    # 버전 업 / 업데이트
+    ("update_version", ("버전", "version", "올려", "업데이트", "업그레이드")),
+    # self-check / 점검 / 테스트
+    ("run_selfcheck", ("체크", "점검", "self-check", "selfcheck", "검사")),
+    # 실행 / 테스트
+    ("run_task", ("실행", "run", "test")),
+)
 
-    return "Unknown"
 
+def _compile_keywords(table):
+    """
+    키워드 테이블을 하나의 정규식(라벨별 named group)과 라벨→순위 dict로 만든다.
+    텍스트를 한 번만 스캔해서 가장 우선순위가 높은 라벨을 고를 수 있다.
+    """
+    pattern = re.compile("|".join(
+        f"(?P<{label}>{'|'.join(map(re.escape, words))})"
+        for label, words in table
+    ))
+    rank = {label: i for i, (label, _) in enumerate(table)}
+    return pattern, rank
 
-def _detect_intent_type(text: str) -> str:
-    t = text.lower()
 
-    # 기능 생성 / 추가
-    if any(k in t for k in ["기능", "feature", "새로", "만들어", "만들어줘", "추가해", "추가해줘"]):
-        return "create_feature"
+_MODULE_RE, _MODULE_RANK = _compile_keywords(MODULE_KEYWORDS)
+_INTENT_RE, _INTENT_RANK = _compile_keywords(INTENT_KEYWORDS)
 
-    # 버전 업 / 업데이트
-    if any(k in t for k in ["버전", "version", "올려", "업데이트", "업그레이드"]):
-        return "update_version"
+# 아주 단순한 버전 패턴 (예: "3.5", "v3.5")
+_VERSION_RE = re.compile(r"v?\s*(\d+\.\d+)")
 
-    # self-check / 점검 / 테스트
-    if any(k in t for k in ["체크", "점검", "self-check", "selfcheck", "검사"]):
-        return "run_selfcheck"
 
-    # 실행 / 테스트
-    if any(k in t for k in ["실행", "run", "test"]):
-        return "run_task"
+def _best_label(pattern, rank, text: str, default: str) -> str:
+    best = default
+    best_rank = len(rank)
+    for m in pattern.finditer(text):
+        r = rank[m.lastgroup]
+        if r < best_rank:
+            best, best_rank = m.lastgroup, r
+            if r == 0:
+                break
+    return best
 
-    return "unknown"
 
+# 아래 감지 함수들은 이미 소문자로 바꾼 텍스트를 받는다 (analyze_command에서 한 번만 변환)
+def _detect_module(t: str) -> str:
+    return _best_label(_MODULE_RE, _MODULE_RANK, t, "Unknown")
 
-def _detect_version_hint(text: str) -> Optional[str]:
-    # 아주 단순한 버전 패턴 감지 (예: "3.5", "v3.5")
-    import re
 
-    m = re.search(r"v?\s*(\d+\.\d+)", text.lower())
+def _detect_intent_type(t: str) -> str:
+    return _best_label(_INTENT_RE, _INTENT_RANK, t, "unknown")
+
+
+def _detect_version_hint(t: str) -> Optional[str]:
+    m = _VERSION_RE.search(t)
     if m:
         return m.group(1)
     return None
@@ -77,9 +100,10 @@ def analyze_command(command_id: str, text: str) -> Dict:
     """
     단일 명령 문자열을 CommandIntent 구조로 변환한다.
     """
-    intent_type = _detect_intent_type(text)
-    target_module = _detect_module(text)
-    version_hint = _detect_version_hint(text)
+    t = text.lower()
+    intent_type = _detect_intent_type(t)
+    target_module = _detect_module(t)
+    version_hint = _detect_version_hint(t)
 
     notes_parts = []
 
@@ -0,0 +1,49 @@
+"""
+AS_core.py
+AutoSync - 드라이버 공용 스냅샷 헬퍼 (변경 감지 + 지문)
+
+v3.x 드라이버마다 따로 갖고 있던 detect_changes / compute_snapshot_hash 를 한 곳으로 모았다.
+스냅샷은 build_snapshot이 만든 {"<폴더명>/<상대경로>": mtime} dict를 그대로 사용한다.
+"""
+
+import hashlib
+import struct
+from typing import Dict, List
+
+
+# 지문 항목 = 경로(UTF-8) + NUL 구분자 + mtime(8바이트 double)
+# mtime을 10진 문자열로 바꾸지 않고 그대로 해시에 넣는다
+_SEP_MTIME = struct.Struct("<xd")
+
+
+def detect_changes(old: Dict[str, float], new: Dict[str, float]) -> Dict[str, List[str]]:
+    # dict view 집합 연산은 C 레벨에서 처리되므로 키별 파이썬 루프 비교를 피한다
+    # (new.items() - old.items()) = 새로 생겼거나 mtime이 바뀐 항목
+    changed = {k for k, _ in new.items() - old.items()}
+
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "modified": sorted(changed.intersection(old)),
+        "deleted": sorted(old.keys() - new.keys()),
+    }
+
+
+def compute_snapshot_hash(files: Dict[str, float]) -> str:
+    # 내부 지문 용도이므로 SHA-256 대신 더 빠른 BLAKE2b 사용, 큰 문자열 없이 항목별로 누적
+    # build_snapshot이 결정적인 순서로 기록하므로 다시 정렬하지 않고 그대로 누적
+    h = hashlib.blake2b(digest_size=32)
+    for p, m in files.items():
+        h.update(p.encode("utf-8"))
+        h.update(_SEP_MTIME.pack(m))
+    return h.hexdigest()
+
+
+def compute_file_hash(path) -> str:
+    """
+    파일 내용(bytes)의 BLAKE2b 지문. 파일이 없으면 "" 을 반환한다.
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=32).hexdigest()
+    except OSError:
+        return ""
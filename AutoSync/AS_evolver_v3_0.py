@@ -11,28 +11,59 @@ CAPS AutoSync 3.0 - 진화 제안 엔진(Evolver, Sandbox Mode)
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 
+from AS_io_cache import save_json
+from log_utils import now_str
+
 
 BASE_DIR = Path(__file__).resolve().parent
 GENERATED_DIR = BASE_DIR / "generated"
 
 
 def safe_print(msg: str) -> None:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[EVOLVER] {ts} | {msg}")
+    print(f"[EVOLVER] {now_str()} | {msg}")
 
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_json(path: Path, data: dict) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    기존 파일 내용이 data와 다를 때만 기록한다. 실제로 기록했으면 True.
+    (크기가 다르면 읽지 않고 바로 기록)
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+# 모듈별 Self-Check 스텁 코드 템플릿 (모듈 로드 시 한 번만 만들고 format_map으로 채움)
+SELFCHECK_STUB_TEMPLATE = '''"""
+{stub_name}
+AutoSync v3.0 - {module_name}용 Self-Check 스텁
+
+이 파일은 AutoSync가 제안한 샘플 코드이며,
+실제 시스템에 바로 연결되지 않습니다.
+
+필요 시 내용을 채운 뒤, 수동으로 해당 모듈 폴더로 옮겨서 사용하세요.
+"""
+
+def run_self_check():
+    # TODO: {module_name} 내부 파일 구조 / 설정값 등을 점검하는 코드를 작성하세요.
+    # 예시:
+    # - 필수 JSON 키 존재 여부
+    # - 파일명 패턴 검증
+    # - 설정값 범위 검사 등
+    print("Self-check for module: {module_name} (stub)")
+'''
 
 
 def build_proposals(
@@ -82,26 +113,12 @@ def build_proposals(
 
         # 간단한 스텁 코드 생성 (이미 존재하면 덮어쓰지 않고 유지해도 되지만,
         # 여기서는 항상 최신 버전으로 덮어쓴다.)
-        stub_code = f'''"""
-{stub_name}
-AutoSync v3.0 - {module_name}용 Self-Check 스텁
-
-이 파일은 AutoSync가 제안한 샘플 코드이며,
-실제 시스템에 바로 연결되지 않습니다.
-
-필요 시 내용을 채운 뒤, 수동으로 해당 모듈 폴더로 옮겨서 사용하세요.
-"""
-
-def run_self_check():
-    # TODO: {module_name} 내부 파일 구조 / 설정값 등을 점검하는 코드를 작성하세요.
-    # 예시:
-    # - 필수 JSON 키 존재 여부
-    # - 파일명 패턴 검증
-    # - 설정값 범위 검사 등
-    print("Self-check for module: {module_name} (stub)")
-'''
+        stub_code = SELFCHECK_STUB_TEMPLATE.format_map(
+            {"stub_name": stub_name, "module_name": module_name}
+        )
 
-        stub_path.write_text(stub_code, encoding="utf-8")
+        # 내용이 같으면 다시 쓰지 않음 (generated_files 에는 항상 포함)
+        write_if_changed(stub_path, stub_code.encode("utf-8"))
         generated_files.append(str(stub_path))
 
         proposals.append(
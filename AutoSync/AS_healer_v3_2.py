@@ -14,10 +14,13 @@ AutoSync 3.2 - Self-Healing Engine (JSON-Level Auto Fixes)
 
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
+from AS_io_cache import save_json
+from json_io import load_file
+
 
 # 기본값 셋
 DEFAULT_SGD_STATE = {
@@ -33,18 +36,13 @@ DEFAULT_SCH_SETTINGS = {
 
 
 def load_json_safe(path: Path):
+    # 읽은 dict를 직접 보정(fix_missing_fields)하므로 공유 캐시(load_json) 대신 매번 새로 파싱
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f), None
+        return load_file(path), None
     except Exception as e:
         return None, str(e)
 
 
-def save_json(path: Path, data):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
 def fix_missing_fields(data: Dict, required: Dict[str, Any]) -> Tuple[Dict, bool]:
     changed = False
     for key, default_value in required.items():
@@ -82,9 +80,22 @@ def heal_snapshot(snapshot: Dict[str, float], base_dir: Path) -> Tuple[Dict, Lis
     issues = []
     cleaned = {}
 
+    # 파일마다 exists()(stat) 하지 않고, 항목이 속한 폴더를 한 번씩만 scandir 해서
+    # 폴더별 파일 이름 집합으로 존재 여부를 확인한다
+    listing: Dict[str, set] = {}
+
     for rel, mtime in snapshot.items():
-        full = base_dir / rel
-        if not full.exists():
+        parent, _, name = rel.rpartition("/")
+        names = listing.get(parent)
+        if names is None:
+            try:
+                with os.scandir(base_dir / parent) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            listing[parent] = names
+
+        if name not in names:
             issues.append(f"SNAPSHOT_MISSING_FILE:{rel}")
             continue
         cleaned[rel] = mtime
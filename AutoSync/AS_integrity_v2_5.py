@@ -13,31 +13,32 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 
 
-def check_required_files(snapshot: Dict[str, float]) -> List[str]:
-    """
-    각 모듈의 필수 파일이 존재하는지 검사한다.
-    """
-    required = [
-        # OmegaEngine 핵심 엔진 파일
-        "OmegaEngine/OMG_main_engine_static_v26.py",
-        "OmegaEngine/OMG_engine_gpt_v27.py",
-        "OmegaEngine/OMG_version.json",
+# 각 모듈의 필수 파일 (모듈 로드 시 한 번만 생성, 순서 고정 → 결과 순서도 항상 동일)
+REQUIRED_FILES: Tuple[str, ...] = (
+    # OmegaEngine 핵심 엔진 파일
+    "OmegaEngine/OMG_main_engine_static_v26.py",
+    "OmegaEngine/OMG_engine_gpt_v27.py",
+    "OmegaEngine/OMG_version.json",
+
+    # Scheduler 핵심 파일
+    "Scheduler/SCH_scheduler_v1_7_1.py",
+    "Scheduler/SCH_settings.json",
 
-        # Scheduler 핵심 파일
-        "Scheduler/SCH_scheduler_v1_7_1.py",
-        "Scheduler/SCH_settings.json",
+    # SafeGuard 핵심 파일
+    "SafeGuard/SGD_safe_guard_v1_3.py",
+    "SafeGuard/SGD_state.json",
 
-        # SafeGuard 핵심 파일
-        "SafeGuard/SGD_safe_guard_v1_3.py",
-        "SafeGuard/SGD_state.json",
+    # AutoSync 핵심 파일
+    "AutoSync/AS_autosync_v2_0.py",
+    "AutoSync/AS_processor_v2_0.py",
+)
 
-        # AutoSync 핵심 파일
-        "AutoSync/AS_autosync_v2_0.py",
-        "AutoSync/AS_processor_v2_0.py",
-    ]
 
-    missing = [path for path in required if path not in snapshot]
-    return missing
+def check_required_files(snapshot: Dict[str, float]) -> List[str]:
+    """
+    각 모듈의 필수 파일이 존재하는지 검사한다.
+    """
+    return [path for path in REQUIRED_FILES if path not in snapshot]
 
 
 def compute_risk_score(
@@ -78,7 +79,8 @@ def run_integrity_check(
     # 1) 필수 파일 검사
     missing = check_required_files(snapshot)
     if missing:
-        issues.append(f"MISSING_FILES:{missing}")
+        # 경로 목록은 반환 dict의 "missing_files"에 있으므로 issue에는 개수만 기록
+        issues.append(f"MISSING_FILES:{len(missing)}")
 
     # 2) JSON 파싱 문제는 autosync_state.issues 에 이미 들어있음
     json_issues = autosync_state.get("issues", [])
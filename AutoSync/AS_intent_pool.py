@@ -0,0 +1,49 @@
+"""
+AS_intent_pool.py
+AutoSync - intent 병렬 처리 (ProcessPoolExecutor)
+
+intent들을 "리소스 키"(같은 파일을 건드리는 단위)별로 묶어서,
+같은 키의 intent는 한 워커 안에서 원래 순서대로 처리하고
+서로 다른 키끼리만 병렬로 실행한다. (같은 스텁/백업 파일을 동시에 쓰지 않도록)
+키가 None인 intent(파일을 건드리지 않고 바로 SKIP 되는 것)는 워커로 보내지 않는다.
+
+결과 리스트는 입력 intents 순서와 동일하다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+
+def _run_group(func, group):
+    return [(idx, func(intent)) for idx, intent in group]
+
+
+def map_intents(func, intents, key, max_workers=None):
+    """
+    func(intent)를 모든 intent에 적용한 결과 리스트를 반환한다.
+    - func, key는 워커로 넘어가므로 모듈 최상위 함수여야 한다.
+    - 리소스 키가 하나뿐이면 프로세스를 띄우지 않고 그대로 순차 처리한다.
+    - 키가 None인 intent는 풀을 띄울지 판단할 때 세지 않고 현재 프로세스에서 처리한다.
+    """
+    groups = {}
+    inline = []
+    for idx, intent in enumerate(intents):
+        k = key(intent)
+        if k is None:
+            inline.append((idx, intent))
+        else:
+            groups.setdefault(k, []).append((idx, intent))
+
+    if len(groups) <= 1:
+        return [func(intent) for intent in intents]
+
+    results = [None] * len(intents)
+    for idx, result in _run_group(func, inline):
+        results[idx] = result
+    workers = min(len(groups), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for pairs in ex.map(_run_group, repeat(func), groups.values(), chunksize=4):
+            for idx, result in pairs:
+                results[idx] = result
+    return results
@@ -0,0 +1,62 @@
+"""
+AS_io_cache.py
+AutoSync - JSON 파일 읽기 캐시 (프로세스 공용) + 저장
+
+같은 실행 안에서 같은 JSON 파일을 여러 번 읽을 때,
+(경로, mtime_ns, size)가 그대로면 다시 파싱하지 않고 캐시된 객체를 돌려준다.
+파일이 수정되면 mtime/size가 바뀌므로 자동으로 다시 읽는다.
+
+주의: 반환값은 캐시와 공유되는 객체이므로 읽기 전용으로 사용한다.
+      수정이 필요하면 호출 측에서 복사본을 만든다.
+"""
+
+import os
+from functools import lru_cache
+
+from json_io import PRETTY, dumps, loads, write_atomic
+
+
+@lru_cache(maxsize=64)
+def _parse_cached(path_str: str, mtime_ns: int, size: int):
+    with open(path_str, "rb") as f:
+        return loads(f.read())
+
+
+def load_json(path, default=None):
+    """
+    path의 JSON을 읽어 반환한다. 파일이 없거나 깨져 있으면 default({})를 반환한다.
+    """
+    if default is None:
+        default = {}
+    try:
+        st = os.stat(path)
+        return _parse_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+    except Exception:
+        return default
+
+
+def save_json(path, data) -> None:
+    """
+    data를 2칸 들여쓰기 UTF-8 JSON으로 저장한다. (orjson이 있으면 C 구현으로 직렬화)
+    bytes 한 덩어리를 임시 파일에 쓰고 os.replace로 교체하므로, 저장 도중 중단돼도 기존 파일이 깨지지 않는다.
+    """
+    write_atomic(path, dumps(data, pretty=True))
+
+
+def save_json_compact(path, data) -> None:
+    """
+    프로그램만 읽는 JSON(state/plan 등)을 들여쓰기 없이 저장한다. (CAPS_PRETTY=1 이면 들여쓰기)
+    """
+    write_atomic(path, dumps(data, pretty=PRETTY))
+
+
+def save_json_batch(items) -> None:
+    """
+    여러 JSON 파일을 한 번에 저장한다. items: [(path, data, pretty), ...]
+    - 모든 항목을 먼저 직렬화한 뒤 연달아 기록하므로, 직렬화 중 오류가 나면 어떤 파일도 바뀌지 않는다.
+    - state처럼 프로그램만 읽는 파일은 pretty=PRETTY(기본 False)로 넘겨 압축 저장한다.
+    - fsync는 CAPS_DURABLE=1 일 때만 수행한다. (state/report는 다음 실행에서 다시 만들어짐)
+    """
+    payloads = [(path, dumps(data, pretty=pretty)) for path, data, pretty in items]
+    for path, payload in payloads:
+        write_atomic(path, payload)
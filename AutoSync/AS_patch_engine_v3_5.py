@@ -11,20 +11,39 @@ AutoSync 3.5 - 제한적 코드 자동 수정 엔진
 from __future__ import annotations
 from pathlib import Path
 import json
+import mmap
+import os
 import shutil
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from log_utils import now_str
 
 
 BASE_DIR = Path(__file__).resolve().parent
 PATCH_DIR = BASE_DIR / "patches"
 PATCH_DIR.mkdir(exist_ok=True)
 
+# "# Version: x.x" 헤더 패턴 (bytes, 모듈 로드 시 한 번만 컴파일)
+_VER_HDR_RE = re.compile(rb"(#\s*Version:\s*)(\d+\.\d+)")
+# 헤더는 파일 맨 앞 몇 줄에 있으므로 먼저 이 범위(줄 단위로 자름)만 검사
+_VER_HDR_SCAN = 512
+
 
 def safe_print(msg: str):
-    from datetime import datetime
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[PATCH] {ts} | {msg}")
+    print(f"[PATCH] {now_str()} | {msg}")
+
+
+def copy_atomic(src: Path, dst: Path) -> None:
+    """
+    src를 dst 옆의 임시 파일로 복사한 뒤 os.replace로 교체한다.
+    - shutil.copyfile은 가능한 경우 커널 복사(sendfile 등)를 사용
+    - 메타데이터(copystat)는 복사하지 않음
+    - 복사 도중 중단돼도 기존 dst(이전 백업)는 깨지지 않는다
+    """
+    tmp = dst.with_name(dst.name + ".tmp")
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
 
 
 def backup_file(path: Path):
@@ -35,27 +54,67 @@ def backup_file(path: Path):
         return None
 
     backup_path = PATCH_DIR / f"{path.name}.bak"
-    shutil.copy2(path, backup_path)
+    copy_atomic(path, backup_path)
     return str(backup_path)
 
 
+def replace_version_header(data: bytes, new_version: str) -> Optional[bytes]:
+    """
+    파일 내용(bytes)의 "# Version: x.x" 를 new_version으로 바꾼 결과를 반환한다. 바뀐 것이 없으면 None.
+    - 앞부분(_VER_HDR_SCAN 바이트 안의 완전한 줄들)에서 헤더를 찾으면 그 부분만 치환
+    - 앞부분에 헤더가 없을 때만 파일 전체를 대상으로 치환
+    """
+    ver = new_version.encode("utf-8")
+
+    def repl(m):
+        return m.group(1) + ver
+
+    cut = data.rfind(b"\n", 0, _VER_HDR_SCAN) + 1
+    new_head, n = _VER_HDR_RE.subn(repl, data[:cut])
+    if n:
+        new_data = new_head + data[cut:]
+    else:
+        new_data = _VER_HDR_RE.sub(repl, data)
+
+    return new_data if new_data != data else None
+
+
+def version_header_up_to_date(path: Path, new_version: str) -> bool:
+    """
+    파일을 mmap으로 열어 헤더만 확인한다. 헤더가 없거나 이미 new_version이면 True.
+    (이 경우 파일 내용을 메모리로 읽어들이지 않고 바로 끝냄)
+    """
+    ver = new_version.encode("utf-8")
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # replace_version_header와 같은 순서: 앞부분에 헤더가 있으면 앞부분만 본다
+            cut = mm.rfind(b"\n", 0, _VER_HDR_SCAN) + 1
+            found = False
+            for m in _VER_HDR_RE.finditer(mm, 0, cut):
+                found = True
+                if m.group(2) != ver:
+                    return False
+            if found:
+                return True
+            return all(m.group(2) == ver for m in _VER_HDR_RE.finditer(mm))
+    except ValueError:
+        # 빈 파일은 mmap 할 수 없음 → 헤더 없음
+        return True
+
+
 def update_version_header(path: Path, new_version: str) -> bool:
     """
     파일 상단에 "# Version: x.x" 형태의 헤더가 있으면 자동 업데이트
     """
     if not path.exists():
         return False
+    if version_header_up_to_date(path, new_version):
+        return False
 
-    text = path.read_text(encoding="utf-8")
-    new_text = re.sub(
-        r"(#\s*Version:\s*)(\d+\.\d+)",
-        rf"\g<1>{new_version}",
-        text
-    )
-
-    if new_text != text:
+    new_data = replace_version_header(path.read_bytes(), new_version)
+    if new_data is not None:
         backup_file(path)
-        path.write_text(new_text, encoding="utf-8")
+        path.write_bytes(new_data)
         return True
 
     return False
@@ -69,11 +128,14 @@ def apply_simple_patch(path: Path, search: str, replace: str) -> bool:
         return False
 
     text = path.read_text(encoding="utf-8")
-    if search not in text:
+
+    # 첫 번째 위치를 찾으면서 동시에 앞/뒤로 나눔 → 나머지 구간만 replace (파일 전체를 두 번 훑지 않음)
+    head, found, tail = text.partition(search)
+    if not found:
         return False
 
     backup_file(path)
-    new_text = text.replace(search, replace)
+    new_text = head + replace + tail.replace(search, replace)
     path.write_text(new_text, encoding="utf-8")
     return True
 
@@ -101,6 +163,17 @@ def run_feature():
     return stub_path
 
 
+def intent_resource_key(intent: Dict[str, Any]) -> str:
+    """
+    intent가 건드리는 파일 단위 키 (병렬 처리 시 같은 키끼리는 순차 실행)
+    - update_version: 항상 AS_autosync_v3_0.py 를 수정
+    - 그 외: 모듈별 스텁 파일
+    """
+    if intent.get("intent_type") == "update_version":
+        return "AS_autosync_v3_0.py"
+    return str(intent.get("target_module"))
+
+
 def process_intent(intent: Dict[str, Any]) -> Dict[str, Any]:
     """
     단일 intent 처리.
@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Dict, Any, List
 import shutil
 
-from AS_patch_engine_v3_5 import process_intent as base_process_intent, safe_print
+from AS_patch_engine_v3_5 import process_intent as base_process_intent, copy_atomic, intent_resource_key, safe_print
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -28,7 +28,7 @@ def _backup_if_exists(path: Path) -> str | None:
     if not path.exists():
         return None
     backup_path = path.with_suffix(path.suffix + ".bak")
-    shutil.copy2(path, backup_path)
+    copy_atomic(path, backup_path)
     return str(backup_path)
 
 
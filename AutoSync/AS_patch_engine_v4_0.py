@@ -13,34 +13,49 @@ AutoSync 4.0 - Full Patch Engine
 - 특정 함수 덧붙이기
 - 파일 끝에 추가 함수 붙이기
 - config 내부 key 업데이트
+
+환경 변수:
+- AUTOSYNC_FULL_SIM=1 : 문법 검사 후 별도 인터프리터(`python -m py_compile`)로 한 번 더 검증한다.
+                        (CI 전용. 기본 경로에서는 서브프로세스를 띄우지 않는다)
 """
 
 from __future__ import annotations
-import json, shutil, re
-from pathlib import Path
-from typing import Dict, Any
+import importlib.util
+import json, os, shutil
+import py_compile
 import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from log_utils import now_str
+from AS_patch_engine_v3_5 import copy_atomic, replace_version_header, version_header_up_to_date
 
 
 BASE = Path(__file__).resolve().parent
 PATCH_DIR = BASE / "patches"
 SANDBOX = BASE / "sandbox"
 
+# 현재 버전에서 실제 패치 가능한 모듈 → 대상 파일 (그 외 모듈은 SKIP)
+PATCHABLE_MODULES = {
+    "Scheduler": BASE.parent / "Scheduler" / "SCH_new_feature_v3_6_stub.py",
+}
+
+FULL_SIM = bool(os.environ.get("AUTOSYNC_FULL_SIM"))
+
 PATCH_DIR.mkdir(exist_ok=True)
 SANDBOX.mkdir(exist_ok=True)
 
 
 def safe_print(msg: str):
-    from datetime import datetime
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[PATCH-4.0] {ts} | {msg}")
+    print(f"[PATCH-4.0] {now_str()} | {msg}")
 
 
 def backup_file(path: Path) -> Path | None:
     if not path.exists():
         return None
     backup = path.with_suffix(path.suffix + ".bak")
-    shutil.copy2(path, backup)
+    copy_atomic(path, backup)
     return backup
 
 
@@ -58,12 +73,11 @@ def update_version_header(path: Path, new: str) -> bool:
     """
     # Version: x.x  →  # Version: new
     """
-    if not path.exists():
+    if not path.exists() or version_header_up_to_date(path, new):
         return False
-    txt = path.read_text(encoding="utf-8")
-    new_txt = re.sub(r"(#\s*Version:\s*)(\d+\.\d+)", rf"\1{new}", txt)
-    if new_txt != txt:
-        path.write_text(new_txt, encoding="utf-8")
+    new_data = replace_version_header(path.read_bytes(), new)
+    if new_data is not None:
+        path.write_bytes(new_data)
         return True
     return False
 
@@ -74,18 +88,18 @@ def append_function(path: Path, func_name: str, code: str) -> bool:
     """
     if not path.exists():
         return False
-    original = path.read_text(encoding="utf-8")
     addition = f"\n\ndef {func_name}():\n" + "\n".join([f"    {line}" for line in code.splitlines()])
-    new_txt = original + addition
-    path.write_text(new_txt, encoding="utf-8")
+    # 기존 내용을 읽어 다시 쓰지 않고 끝에 덧붙이기만 한다
+    with path.open("a", encoding="utf-8") as f:
+        f.write(addition)
     return True
 
 
 def syntax_check(path: Path) -> list:
     issues = []
     try:
-        src = path.read_text(encoding="utf-8")
-        compile(src, str(path), "exec")
+        # compile은 bytes를 그대로 받는다 (인코딩 선언 처리 포함) → 디코딩 사본 없음
+        compile(path.read_bytes(), str(path), "exec")
     except SyntaxError as e:
         issues.append(f"SYNTAX_ERROR:{e.msg} at line {e.lineno}")
     except Exception as e:
@@ -95,11 +109,11 @@ def syntax_check(path: Path) -> list:
 
 def simulate_patch(path: Path) -> bool:
     """
-    sandbox 파일을 실제로 `python -m py_compile` 로 검증해본다.
+    sandbox 파일을 실제로 `python -m py_compile` 로 검증해본다. (AUTOSYNC_FULL_SIM 일 때만 사용)
     """
     try:
         res = subprocess.run(
-            ["python", "-m", "py_compile", str(path)],
+            [sys.executable, "-m", "py_compile", str(path)],
             capture_output=True, text=True
         )
         return res.returncode == 0
@@ -107,6 +121,23 @@ def simulate_patch(path: Path) -> bool:
         return False
 
 
+def write_bytecode_cache(path: Path) -> bool:
+    """
+    path의 __pycache__/*.pyc 를 미리 만들어 둔다. (다음 import 때 다시 컴파일하지 않도록)
+    캐시 생성 실패는 패치 결과에 영향을 주지 않는다.
+    """
+    try:
+        py_compile.compile(
+            str(path),
+            cfile=importlib.util.cache_from_source(str(path)),
+            dfile=str(path),
+            doraise=True,
+        )
+        return True
+    except (py_compile.PyCompileError, OSError):
+        return False
+
+
 def apply_safe_patch(target: Path, changes: Dict[str, Any]):
     """
     safe patching:
@@ -133,6 +164,17 @@ def apply_safe_patch(target: Path, changes: Dict[str, Any]):
     return patched
 
 
+def intent_resource_key(intent: Dict[str, Any]) -> Optional[str]:
+    """
+    full_patch가 수정하는 대상 파일 단위 키 (현재는 모듈당 파일 1개)
+    패치 대상이 아닌 모듈은 full_patch가 바로 SKIP 하므로 None (워커 풀로 보내지 않음)
+    """
+    module = intent.get("target_module")
+    if module not in PATCHABLE_MODULES:
+        return None
+    return str(module)
+
+
 def full_patch(intent: Dict[str, Any]) -> Dict[str, Any]:
     """
     AutoSync 4.0 가장 중요한 함수.
@@ -145,9 +187,8 @@ def full_patch(intent: Dict[str, Any]) -> Dict[str, Any]:
     ver_hint = intent.get("target_version")
 
     # 현재 버전에서 실제 패치 가능한 대상(안전 영역)
-    if module == "Scheduler":
-        target = BASE.parent / "Scheduler" / "SCH_new_feature_v3_6_stub.py"
-    else:
+    target = PATCHABLE_MODULES.get(module)
+    if target is None:
         return {"status": "SKIP", "patched": [], "errors": []}
 
     # target 존재 확인
@@ -177,17 +218,20 @@ def full_patch(intent: Dict[str, Any]) -> Dict[str, Any]:
     # 2) sandbox에 패치
     patched = apply_safe_patch(sfile, changes)
 
-    # 3) syntax check
+    # 3) syntax check (프로세스 안에서 compile)
     issues = syntax_check(sfile)
     if issues:
         return {"status": "BLOCK", "patched": [], "errors": issues}
 
-    # 4) simulate
-    if not simulate_patch(sfile):
+    # 3-1) 별도 인터프리터 검증은 AUTOSYNC_FULL_SIM 이 켜져 있을 때만 (CI용)
+    if FULL_SIM and not simulate_patch(sfile):
         return {"status": "BLOCK", "patched": [], "errors": ["SIMULATION_FAILED"]}
 
-    # 5) 실제 적용
+    # 4) 실제 적용
     backup_file(target)
     shutil.copy2(sfile, target)
 
+    # 5) 적용된 파일의 바이트코드 캐시 갱신
+    write_bytecode_cache(target)
+
     return {"status": "APPLIED", "patched": patched, "errors": []}
@@ -12,9 +12,14 @@ AutoSync 3.7 - Patch Safety Guard (검증 전용, 코드 수정 없음)
 
 from __future__ import annotations
 
+import ast
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
+from log_utils import now_str
+
 
 BASE_DIR = Path(__file__).resolve().parent
 PATCH_DIR = BASE_DIR / "patches"
@@ -34,11 +39,131 @@ DANGEROUS_PATTERNS = [
     "rm -rf",
 ]
 
+# 폴더 경로(parts 튜플) → 모듈 태그. 가장 긴(가장 안쪽) 접두 경로가 우선
+_MODULE_PREFIXES = {
+    tuple(d.resolve().parts): tag
+    for d, tag in (
+        (SCHEDULER_DIR, "Scheduler"),
+        (OMEGA_DIR, "OmegaEngine"),
+        (SAFEGUARD_DIR, "SafeGuard"),
+        (AUTOSYNC_DIR, "AutoSync"),
+        (PATCH_DIR, "PatchSandbox"),
+    )
+}
+
+# 검사할 파일이 이보다 적으면 프로세스 풀을 띄우지 않고 바로 처리
+PARALLEL_MIN_FILES = 4
+
+# 문법 오류로 AST를 만들 수 없을 때만 사용하는 바이트 스캔 (모든 패턴을 정규식 하나로, 디코딩 없이)
+_DANGER_RE = re.compile(b"|".join(re.escape(p.encode("ascii")) for p in DANGEROUS_PATTERNS))
+
+# AST 검사용: 참조 이름 → DANGEROUS_PATTERNS 항목
+# 마지막 구성요소만 보고 판정 (eval, builtins.eval, x.exec 모두 해당)
+_DANGEROUS_LAST = {
+    "eval": "eval(",
+    "exec": "exec(",
+}
+# 모듈까지 포함한 마지막 두 구성요소로 판정 (import 별칭은 원래 이름으로 풀어서 비교)
+_DANGEROUS_QUALIFIED = {
+    "os.system": "os.system(",
+    "subprocess.Popen": "subprocess.Popen",
+    "subprocess.call": "subprocess.call",
+}
+
+
+def _dotted_name(node: ast.AST) -> str | None:
+    """
+    Name/Attribute 체인을 "a.b.c" 문자열로 만든다. 그 외 형태면 None.
+    """
+    parts: List[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return None
+
+
+class _DangerVisitor(ast.NodeVisitor):
+    """
+    코드 안의 이름 참조(호출이 아니어도, 예: p = subprocess.Popen)와 문자열 상수를 검사한다.
+    주석과 docstring(단독 문자열 문장)은 실행되지 않으므로 오탐하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.found: set = set()
+        # import 별칭 → 원래 이름 (import subprocess as sp / from os import system)
+        self.aliases: Dict[str, str] = {}
+
+    def scan(self, tree: ast.AST) -> set:
+        # 별칭을 먼저 모아 두어야 import보다 앞서 나온 참조도 풀 수 있다
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for a in node.names:
+                    if a.asname:
+                        self.aliases[a.asname] = a.name
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                for a in node.names:
+                    if a.name != "*":
+                        self.aliases[a.asname or a.name] = f"{node.module}.{a.name}"
+        self.visit(tree)
+        return self.found
+
+    def _check_name(self, name: str) -> None:
+        head, _, rest = name.partition(".")
+        head = self.aliases.get(head, head)
+        parts = (f"{head}.{rest}" if rest else head).split(".")
+        pat = _DANGEROUS_LAST.get(parts[-1]) or _DANGEROUS_QUALIFIED.get(".".join(parts[-2:]))
+        if pat:
+            self.found.add(pat)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self._check_name(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        name = _dotted_name(node)
+        if name is not None:
+            self._check_name(name)
+        else:
+            # __import__("x").eval 처럼 앞부분을 이름으로 풀 수 없으면 마지막 속성만 본다
+            pat = _DANGEROUS_LAST.get(node.attr)
+            if pat:
+                self.found.add(pat)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        name = _dotted_name(node.func)
+        args = node.args
+        if name is not None and name.rpartition(".")[2] == "open" and args:
+            arg = args[0]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str) and arg.value.startswith("/etc"):
+                self.found.add("open('/etc")
+        elif name == "getattr" and len(args) >= 2:
+            # getattr(subprocess, "Popen") / getattr(builtins, "eval")
+            attr = args[1]
+            if isinstance(attr, ast.Constant) and isinstance(attr.value, str):
+                owner = _dotted_name(args[0])
+                self._check_name(f"{owner}.{attr.value}" if owner else attr.value)
+        self.generic_visit(node)
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        # docstring 등 단독 문자열 문장은 건너뛴다
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, (str, bytes)):
+            return
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        # 문자열로 전달되는 코드/명령 (exec 대상, 셸 명령 등)은 기존 패턴 그대로 검사
+        value = node.value
+        if isinstance(value, str):
+            value = value.encode("utf-8", "surrogatepass")
+        if isinstance(value, bytes):
+            self.found.update(m.group().decode("ascii") for m in _DANGER_RE.finditer(value))
+
 
 def safe_print(msg: str) -> None:
-    from datetime import datetime
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[GUARD] {ts} | {msg}")
+    print(f"[GUARD] {now_str()} | {msg}")
 
 
 def _categorize_file(path: Path) -> str:
@@ -46,20 +171,15 @@ def _categorize_file(path: Path) -> str:
     파일이 어느 모듈에 속했는지 간단히 태그 지정.
     """
     try:
-        p = path.resolve()
+        parts = path.resolve().parts
     except FileNotFoundError:
         return "Unknown"
 
-    if str(p).startswith(str(SCHEDULER_DIR)):
-        return "Scheduler"
-    if str(p).startswith(str(OMEGA_DIR)):
-        return "OmegaEngine"
-    if str(p).startswith(str(SAFEGUARD_DIR)):
-        return "SafeGuard"
-    if str(p).startswith(str(AUTOSYNC_DIR)):
-        return "AutoSync"
-    if str(p).startswith(str(PATCH_DIR)):
-        return "PatchSandbox"
+    # 경로를 한 번만 나눠서 안쪽 폴더부터 접두 경로 표를 조회
+    for i in range(len(parts), 0, -1):
+        tag = _MODULE_PREFIXES.get(parts[:i])
+        if tag is not None:
+            return tag
     return "Unknown"
 
 
@@ -70,7 +190,8 @@ def validate_python_syntax(path: Path) -> List[str]:
     """
     issues: List[str] = []
     try:
-        src = path.read_text(encoding="utf-8")
+        # bytes 그대로 파싱 (인코딩 선언은 ast.parse가 처리) → str 디코딩 사본을 만들지 않음
+        src = path.read_bytes()
     except FileNotFoundError:
         issues.append("FILE_NOT_FOUND")
         return issues
@@ -78,21 +199,58 @@ def validate_python_syntax(path: Path) -> List[str]:
         issues.append(f"READ_ERROR:{e}")
         return issues
 
+    # 파싱은 한 번만: AST를 compile에 그대로 넘기고, 위험 호출 검사에도 재사용
+    tree = None
     try:
-        compile(src, str(path), "exec")
+        tree = ast.parse(src, str(path))
+        compile(tree, str(path), "exec")
     except SyntaxError as e:
         issues.append(f"SYNTAX_ERROR:{e.msg} at line {e.lineno}")
     except Exception as e:
         issues.append(f"COMPILE_ERROR:{e}")
 
-    # 위험 패턴 검사
-    for pat in DANGEROUS_PATTERNS:
-        if pat in src:
-            issues.append(f"DANGEROUS_PATTERN:{pat}")
+    # 위험 패턴 검사 (결과 순서는 DANGEROUS_PATTERNS 순서 유지)
+    if tree is not None:
+        found = _DangerVisitor().scan(tree)
+    else:
+        found = {m.group().decode("ascii") for m in _DANGER_RE.finditer(src)}
+    if found:
+        issues.extend(f"DANGEROUS_PATTERN:{pat}" for pat in DANGEROUS_PATTERNS if pat in found)
 
     return issues
 
 
+def _check_one(p_str: str) -> Dict[str, Any]:
+    """
+    파일 하나를 검사해 결과 dict를 반환한다. (프로세스 풀 워커에서 실행되므로 모듈 최상위 함수)
+    """
+    p = Path(p_str)
+    module = _categorize_file(p)
+    issues = []
+
+    if p.suffix == ".py":
+        issues = validate_python_syntax(p)
+    else:
+        # .py가 아니면 현재는 단순 통과
+        issues = []
+
+    if not issues:
+        status = "SAFE"
+    else:
+        # 위험 패턴이나 치명적 오류 있으면 BLOCK, 그 외는 WARN
+        if any(i.startswith("DANGEROUS_PATTERN") for i in issues):
+            status = "BLOCK"
+        else:
+            status = "WARN"
+
+    return {
+        "path": str(p),
+        "module": module,
+        "status": status,
+        "issues": issues,
+    }
+
+
 def guard_files(paths: List[str]) -> Dict[str, Any]:
     """
     주어진 경로 리스트에 대해 안전성 검사 실행.
@@ -105,51 +263,19 @@ def guard_files(paths: List[str]) -> Dict[str, Any]:
           'summary': {...}
         }
     """
-    results: List[Dict[str, Any]] = []
-    safe_count = 0
-    warn_count = 0
-    block_count = 0
-
-    for p_str in paths:
-        p = Path(p_str)
-        module = _categorize_file(p)
-        issues = []
-
-        if p.suffix == ".py":
-            issues = validate_python_syntax(p)
-        else:
-            # .py가 아니면 현재는 단순 통과
-            issues = []
-
-        if not issues:
-            status = "SAFE"
-            safe_count += 1
-        else:
-            # 위험 패턴이나 치명적 오류 있으면 BLOCK, 그 외는 WARN
-            if any(i.startswith("DANGEROUS_PATTERN") for i in issues):
-                status = "BLOCK"
-                block_count += 1
-            elif any(i.startswith(("SYNTAX_ERROR", "COMPILE_ERROR")) for i in issues):
-                status = "WARN"
-                warn_count += 1
-            else:
-                status = "WARN"
-                warn_count += 1
-
-        results.append(
-            {
-                "path": str(p),
-                "module": module,
-                "status": status,
-                "issues": issues,
-            }
-        )
+    # 파일별 검사는 서로 독립적(파싱이 대부분인 CPU 작업)이므로 프로세스 풀로 분산
+    if len(paths) < PARALLEL_MIN_FILES:
+        results: List[Dict[str, Any]] = [_check_one(p_str) for p_str in paths]
+    else:
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(_check_one, paths, chunksize=8))
 
+    statuses = [r["status"] for r in results]
     summary = {
         "total": len(paths),
-        "safe": safe_count,
-        "warn": warn_count,
-        "block": block_count,
+        "safe": statuses.count("SAFE"),
+        "warn": statuses.count("WARN"),
+        "block": statuses.count("BLOCK"),
     }
 
     return {"results": results, "summary": summary}
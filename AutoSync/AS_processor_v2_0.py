@@ -7,52 +7,125 @@ CAPS AutoSync 2.0 - 자동 JSON 정규화 / 검증 엔진
 - 변경된 기타 JSON 파일의 파싱 여부를 검증하고 결과 로깅
 """
 
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-# AutoSync state / report에 반드시 있어야 하는 키 목록
-REQUIRED_STATE_KEYS = [
-    "version",
-    "last_scan",
-    "snapshot_hash",
-    "file_count",
-    "modules",
-    "files",
-    "auto_actions",
-    "issues",
-]
-
-REQUIRED_REPORT_KEYS = [
-    "version",
-    "generated_at",
-    "source_state_version",
-    "summary",
-    "changes",
-    "unused_candidates",
-    "module_health",
-    "warnings",
-    "errors",
-    "auto_actions",
-]
+from typing import Any, Callable, Dict, List, Tuple
+
+from json_io import load_file
+from AS_io_cache import save_json, save_json_compact
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# 파싱 검증 전용 파서는 스레드마다 하나씩 만들어 재사용 (simdjson.Parser는 스레드 간 공유 불가)
+_local = threading.local()
+
+# 처리할 JSON이 이보다 적으면 스레드 풀을 띄우지 않고 바로 처리
+PARALLEL_MIN_FILES = 4
+
+# AutoSync state / report에 반드시 있어야 하는 키 → 누락 시 기본값을 만드는 함수 (dict 순서 = 채우는 순서)
+_STATE_DEFAULTS: Dict[str, Callable[[dict], Any]] = {
+    "version": lambda d: "2.0",
+    "last_scan": lambda d: "",
+    "snapshot_hash": lambda d: "",
+    "file_count": lambda d: len(d.get("files", {})),
+    "modules": lambda d: {},
+    "files": lambda d: {},
+    "auto_actions": lambda d: [],
+    "issues": lambda d: [],
+}
+
+_REPORT_DEFAULTS: Dict[str, Callable[[dict], Any]] = {
+    "version": lambda d: "2.0",
+    "generated_at": lambda d: "",
+    "source_state_version": lambda d: "",
+    "summary": lambda d: {
+        "total_files": 0,
+        "scanned_paths": [],
+        "duration_seconds": 0.0,
+    },
+    "changes": lambda d: {"added": [], "modified": [], "deleted": []},
+    "unused_candidates": lambda d: [],
+    "module_health": lambda d: {},
+    "warnings": lambda d: [],
+    "errors": lambda d: [],
+    "auto_actions": lambda d: [],
+}
+
+REQUIRED_STATE_KEYS = list(_STATE_DEFAULTS)
+REQUIRED_REPORT_KEYS = list(_REPORT_DEFAULTS)
+
+# 정규화 대상 AutoSync state / report 파일 (BASE 기준 상대 경로, "/" 구분)
+_STATE_SET = frozenset({
+    "AutoSync/AS_state_v1_5.json",
+    "AutoSync/AS_state_v2_0.json",
+})
+_REPORT_SET = frozenset({
+    "AutoSync/AS_report_v1_5.json",
+    "AutoSync/AS_report_v2_0.json",
+})
+
+# 정규화가 끝난 파일의 (st_mtime_ns, st_size). 같으면 다시 파싱하지 않는다 (같은 프로세스 안에서 반복 스캔 시)
+_NORMALIZED_SIG: Dict[str, Tuple[int, int]] = {}
+
+
+def _file_sig(path: Path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _is_normalized(path: Path) -> bool:
+    sig = _file_sig(path)
+    return sig is not None and _NORMALIZED_SIG.get(str(path)) == sig
+
+
+def _mark_normalized(path: Path) -> None:
+    sig = _file_sig(path)
+    if sig is not None:
+        _NORMALIZED_SIG[str(path)] = sig
 
 
 def load_json_safe(path: Path):
     """JSON 파일을 안전하게 로드한다. 실패 시 에러 메시지 반환."""
+    # 정규화 결과를 수정해야 하므로 캐시(AS_io_cache.load_json)가 아닌 새 객체로 읽는다
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f), None
+        return load_file(path), None
     except Exception as e:
         return None, str(e)
 
 
-def save_json(path: Path, data: dict):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def _validate_json_fast(path: Path):
+    """
+    JSON 파일이 파싱 가능한지만 확인한다. (ok, err) 반환.
+    simdjson이 있으면 파이썬 객체를 만들지 않고 구조만 검증하고, 없으면 load_json_safe로 대신한다.
+    """
+    if simdjson is None:
+        _, err = load_json_safe(path)
+        return err is None, err
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = simdjson.Parser()
+    try:
+        # 반환된 문서 객체는 바로 버려야 파서를 다음 파일에 재사용할 수 있다
+        parser.parse(path.read_bytes())
+        return True, None
+    except Exception as e:
+        return False, str(e)
 
 
 def normalize_autosync_state(path: Path, actions: List[dict], issues: List[str]):
     """AutoSync 상태 JSON에 누락된 필드를 자동으로 채운다."""
+    if _is_normalized(path):
+        return
+
     data, err = load_json_safe(path)
     if data is None:
         issues.append(f"STATE_PARSE_ERROR:{path.name}:{err}")
@@ -60,22 +133,13 @@ def normalize_autosync_state(path: Path, actions: List[dict], issues: List[str])
 
     changed = False
 
-    for key in REQUIRED_STATE_KEYS:
+    for key, factory in _STATE_DEFAULTS.items():
         if key not in data:
-            if key == "version":
-                data[key] = "2.0"
-            elif key in ("modules", "files"):
-                data[key] = {}
-            elif key in ("auto_actions", "issues"):
-                data[key] = []
-            elif key == "file_count":
-                data[key] = len(data.get("files", {}))
-            else:
-                data[key] = ""
+            data[key] = factory(data)
             changed = True
 
     if changed:
-        save_json(path, data)
+        save_json_compact(path, data)
         actions.append(
             {
                 "path": str(path),
@@ -83,10 +147,14 @@ def normalize_autosync_state(path: Path, actions: List[dict], issues: List[str])
                 "detail": "Filled missing keys for AutoSync state v2.0",
             }
         )
+    _mark_normalized(path)
 
 
 def normalize_autosync_report(path: Path, actions: List[dict], issues: List[str]):
     """AutoSync 리포트 JSON에 누락된 필드를 자동으로 채운다."""
+    if _is_normalized(path):
+        return
+
     data, err = load_json_safe(path)
     if data is None:
         issues.append(f"REPORT_PARSE_ERROR:{path.name}:{err}")
@@ -94,24 +162,9 @@ def normalize_autosync_report(path: Path, actions: List[dict], issues: List[str]
 
     changed = False
 
-    for key in REQUIRED_REPORT_KEYS:
+    for key, factory in _REPORT_DEFAULTS.items():
         if key not in data:
-            if key == "version":
-                data[key] = "2.0"
-            elif key == "summary":
-                data[key] = {
-                    "total_files": 0,
-                    "scanned_paths": [],
-                    "duration_seconds": 0.0,
-                }
-            elif key == "changes":
-                data[key] = {"added": [], "modified": [], "deleted": []}
-            elif key == "module_health":
-                data[key] = {}
-            elif key in ("warnings", "errors", "auto_actions", "unused_candidates"):
-                data[key] = []
-            else:
-                data[key] = ""
+            data[key] = factory(data)
             changed = True
 
     if changed:
@@ -123,6 +176,7 @@ def normalize_autosync_report(path: Path, actions: List[dict], issues: List[str]
                 "detail": "Filled missing keys for AutoSync report v2.0",
             }
         )
+    _mark_normalized(path)
 
 
 def process_changed_files(base_dir: Path, changed_paths: Dict[str, List[str]]) -> Tuple[List[dict], List[str]]:
@@ -131,45 +185,57 @@ def process_changed_files(base_dir: Path, changed_paths: Dict[str, List[str]]) -
     - AutoSync 관련 JSON은 정규화
     - 기타 JSON은 파싱 검증
     """
-    actions: List[dict] = []
-    issues: List[str] = []
+    targets = chain(changed_paths.get("modified", ()), changed_paths.get("added", ()))
 
-    autosync_state_candidates = [
-        "AutoSync/AS_state_v1_5.json",
-        "AutoSync/AS_state_v2_0.json",
-    ]
-    autosync_report_candidates = [
-        "AutoSync/AS_report_v1_5.json",
-        "AutoSync/AS_report_v2_0.json",
-    ]
+    # 1) 처리할 JSON만 먼저 골라낸다 (state/report/일반 JSON 모두 .json)
+    jobs = []
+    for rel in targets:
+        norm_rel = rel.replace("\\", "/")
+        if norm_rel.endswith(".json"):
+            jobs.append((base_dir / rel, norm_rel))
 
-    targets = changed_paths.get("modified", []) + changed_paths.get("added", [])
+    # 2) 파일마다 독립적인 읽기/파싱/쓰기 → 스레드 풀에서 동시에 처리 (결과 순서는 입력 순서 유지)
+    if len(jobs) < PARALLEL_MIN_FILES:
+        results = [_process_one(full, norm_rel) for full, norm_rel in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(jobs))) as ex:
+            results = list(ex.map(lambda job: _process_one(*job), jobs))
 
-    for rel in targets:
-        full = base_dir / rel
-        if not full.exists():
-            continue
+    actions: List[dict] = []
+    issues: List[str] = []
+    for a, i in results:
+        actions.extend(a)
+        issues.extend(i)
+    return actions, issues
 
-        norm_rel = rel.replace("\\", "/")
 
-        if norm_rel in autosync_state_candidates:
-            normalize_autosync_state(full, actions, issues)
-
-        elif norm_rel in autosync_report_candidates:
-            normalize_autosync_report(full, actions, issues)
-
-        elif norm_rel.endswith(".json"):
-            # 일반 JSON 파일은 파싱만 검증
-            data, err = load_json_safe(full)
-            if data is None:
-                issues.append(f"JSON_PARSE_ERROR:{norm_rel}:{err}")
-            else:
-                actions.append(
-                    {
-                        "path": str(full),
-                        "action": "validate_json",
-                        "detail": "JSON parsed successfully",
-                    }
-                )
+def _process_one(full: Path, norm_rel: str) -> Tuple[List[dict], List[str]]:
+    """
+    파일 하나를 처리해 (actions, issues)를 반환한다. (스레드 풀 워커에서 실행)
+    """
+    actions: List[dict] = []
+    issues: List[str] = []
+    if not full.exists():
+        return actions, issues
+
+    if norm_rel in _STATE_SET:
+        normalize_autosync_state(full, actions, issues)
+
+    elif norm_rel in _REPORT_SET:
+        normalize_autosync_report(full, actions, issues)
+
+    else:
+        # 일반 JSON 파일은 파싱만 검증
+        ok, err = _validate_json_fast(full)
+        if not ok:
+            issues.append(f"JSON_PARSE_ERROR:{norm_rel}:{err}")
+        else:
+            actions.append(
+                {
+                    "path": str(full),
+                    "action": "validate_json",
+                    "detail": "JSON parsed successfully",
+                }
+            )
 
     return actions, issues
@@ -3,35 +3,45 @@ AS_watcher_v1_4.py
 CAPS AutoSync 1.4 - 파일 스냅샷 유틸리티
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 import json
 import fnmatch
 
 
 def load_rules(rule_file: Path) -> dict:
-    with rule_file.open("r", encoding="utf-8") as f:
+    # (경로, mtime)이 같으면 캐시된 dict 반환 (읽기 전용으로 사용)
+    st = os.stat(rule_file)
+    return _load_rules_cached(os.fspath(rule_file), st.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(path_str: str, mtime_ns: int) -> dict:
+    with open(path_str, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def should_skip(path: Path, rules: dict) -> bool:
-    # 디렉터리 제외
-    for d in rules.get("exclude_dirs", []):
-        if d and d in path.parts:
-            return True
+    # 여러 파일을 검사할 때는 규칙을 frozenset으로 한 번 만들어 _skip을 직접 호출
+    return _skip(
+        path.parts, path.name, path.suffix,
+        frozenset(d for d in rules.get("exclude_dirs", []) if d),
+        frozenset(rules.get("exclude_files", [])),
+        frozenset(rules.get("include_extensions", [])),
+    )
 
-    # 파일 제외
-    for name in rules.get("exclude_files", []):
-        if path.name == name:
-            return True
 
+def _skip(parts, name: str, suffix: str, ex_dirs: frozenset, ex_files: frozenset, exts: frozenset) -> bool:
+    # 디렉터리 제외
+    if ex_dirs and not ex_dirs.isdisjoint(parts):
+        return True
+    # 파일 제외
+    if name in ex_files:
+        return True
     # 확장자 필터
-    exts = rules.get("include_extensions", [])
-    if exts:
-        if path.suffix not in exts:
-            return True
-
-    return False
+    return bool(exts) and suffix not in exts
 
 
 def build_snapshot(base_dir: Path, rules: dict) -> Dict[str, float]:
@@ -39,32 +49,51 @@ def build_snapshot(base_dir: Path, rules: dict) -> Dict[str, float]:
     base_dir 이하의 파일들을 훑어서
     {상대경로: mtime} 형태의 dict를 만든다.
     """
-    snapshot: Dict[str, float] = {}
+    # should_skip 규칙을 순회 전에 한 번만 frozenset으로 준비
+    exclude_dirs = frozenset(d for d in rules.get("exclude_dirs", []) if d)
+    exclude_files = frozenset(rules.get("exclude_files", []))
+    exts = frozenset(rules.get("include_extensions", []))
 
-    for root, dirs, files in os_walk(base_dir):
-        root_path = Path(root)
-        # exclude_dirs 처리
-        dirs[:] = [d for d in dirs if d not in rules.get("exclude_dirs", [])]
+    return dict(_walk(os.fspath(base_dir), exclude_dirs, exclude_files, exts))
 
-        for file in files:
-            file_path = root_path / file
-            rel_path = file_path.relative_to(base_dir)
 
-            if should_skip(rel_path, rules):
+def _walk(
+    base: str,
+    exclude_dirs: frozenset,
+    exclude_files: frozenset,
+    exts: frozenset,
+    rel_prefix: str = "",
+) -> Iterator[Tuple[str, float]]:
+    """
+    os.scandir 재귀로 (상대경로, mtime)을 만든다.
+    DirEntry에 캐시된 타입/stat을 쓰고, 경로는 Path 대신 문자열("/" 구분)로 이어 붙인다.
+    """
+    try:
+        it = os.scandir(base)
+    except OSError:
+        return
+
+    subdirs = []
+    with it:
+        for entry in it:
+            name = entry.name
+            if name in exclude_dirs:
                 continue
-
             try:
-                mtime = file_path.stat().st_mtime
-                snapshot[str(rel_path).replace("\\", "/")] = mtime
-            except FileNotFoundError:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                    continue
+                # os.walk와 동일하게, 디렉터리를 가리키는 심볼릭 링크는 따라가지 않는다
+                if entry.is_symlink() and entry.is_dir():
+                    continue
+                if name in exclude_files:
+                    continue
+                if exts and os.path.splitext(name)[1] not in exts:
+                    continue
+                yield rel_prefix + name, entry.stat().st_mtime
+            except OSError:
                 # 스캔 중 삭제된 경우 무시
                 continue
 
-    return snapshot
-
-
-def os_walk(path: Path):
-    # Path.walk()가 버전에 따라 다를 수 있어서 os.walk 래핑
-    import os
-
-    return os.walk(path)
+    for entry in subdirs:
+        yield from _walk(entry.path, exclude_dirs, exclude_files, exts, f"{rel_prefix}{entry.name}/")
@@ -7,66 +7,134 @@ CAPS AutoSync 1.5 - 파일 스냅샷 유틸리티
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Optional
 import json
 
 
 def load_rules(rule_file: Path) -> dict:
     """
     규칙 파일(JSON)을 로드한다.
+    (경로, mtime)이 같으면 다시 파싱하지 않고 캐시된 dict를 돌려준다. → 반환값은 읽기 전용으로 사용
     """
-    with rule_file.open("r", encoding="utf-8") as f:
+    st = os.stat(rule_file)
+    return _load_rules_cached(os.fspath(rule_file), st.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(path_str: str, mtime_ns: int) -> dict:
+    with open(path_str, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def should_skip(path: Path, rules: dict) -> bool:
     """
     디렉터리/파일 제외 규칙 및 확장자 필터 적용
+    (여러 파일을 검사할 때는 규칙을 frozenset으로 한 번 만들어 _skip을 직접 호출)
     """
-    # 디렉터리 제외
-    for d in rules.get("exclude_dirs", []):
-        if d and d in path.parts:
-            return True
+    return _skip(
+        path.parts, path.name, path.suffix,
+        frozenset(d for d in rules.get("exclude_dirs", []) if d),
+        frozenset(rules.get("exclude_files", [])),
+        frozenset(rules.get("include_extensions", [])),
+    )
 
-    # 파일 제외
-    for name in rules.get("exclude_files", []):
-        if path.name == name:
-            return True
 
-    # 확장자 필터
-    exts = rules.get("include_extensions", [])
-    if exts and path.suffix not in exts:
+def _skip(parts, name: str, suffix: str, ex_dirs: frozenset, ex_files: frozenset, exts: frozenset) -> bool:
+    # 디렉터리 제외
+    if ex_dirs and not ex_dirs.isdisjoint(parts):
         return True
-
-    return False
+    # 파일 제외
+    if name in ex_files:
+        return True
+    # 확장자 필터
+    return bool(exts) and suffix not in exts
 
 
-def build_snapshot(base_dir: Path, rules: dict) -> Dict[str, float]:
+def build_snapshot(
+    base_dir: Path,
+    rules: dict,
+    out: Optional[Dict[str, float]] = None,
+    prefix: str = "",
+) -> Dict[str, float]:
     """
     base_dir 이하의 파일들을 훑어서
     {상대경로: mtime} 형태의 dict를 만든다.
-    """
-    snapshot: Dict[str, float] = {}
 
-    for root, dirs, files in os.walk(base_dir):
-        root_path = Path(root)
+    out을 넘기면 새 dict를 만들지 않고 out에 바로 기록한다.
+    prefix를 넘기면 키가 "<prefix>/<상대경로>" 형태가 된다. (여러 watch_path를 한 dict로 합칠 때 사용)
 
-        # exclude_dirs 처리
-        dirs[:] = [d for d in dirs if d not in rules.get("exclude_dirs", [])]
-
-        for file in files:
-            file_path = root_path / file
-            rel_path = file_path.relative_to(base_dir)
-
-            # 규칙 검사
-            if should_skip(rel_path, rules):
+    기록 순서는 결정적이다: 폴더마다 이름순으로 파일을 먼저 기록하고, 하위 폴더는 이름순 깊이 우선.
+    같은 트리면 항상 같은 순서이므로 지문 계산 시 다시 정렬할 필요가 없다.
+    """
+    snapshot: Dict[str, float] = {} if out is None else out
+    key_prefix = f"{prefix}/" if prefix else ""
+
+    # should_skip과 같은 규칙을 디렉터리 순회 전에 한 번만 frozenset으로 준비
+    exclude_dirs = frozenset(d for d in rules.get("exclude_dirs", []) if d)
+    exclude_files = frozenset(rules.get("exclude_files", []))
+    exts = frozenset(rules.get("include_extensions", []))
+
+    # os.scandir 재귀: DirEntry의 타입/stat 정보를 그대로 써서
+    # 파일마다 Path 객체를 만들고 stat을 다시 호출하는 비용을 없앤다.
+    name_of = attrgetter("name")
+    stack = [(os.fspath(base_dir), key_prefix)]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue
+
+        with it:
+            entries = sorted(it, key=name_of)
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name in exclude_dirs:
                 continue
-
             try:
-                mtime = file_path.stat().st_mtime
-                snapshot[str(rel_path).replace("\\", "/")] = mtime
-            except FileNotFoundError:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, f"{rel_prefix}{name}/"))
+                    continue
+                # os.walk와 동일하게, 디렉터리를 가리키는 심볼릭 링크는 따라가지 않는다
+                if entry.is_symlink() and entry.is_dir():
+                    continue
+                if name in exclude_files:
+                    continue
+                if exts and os.path.splitext(name)[1] not in exts:
+                    continue
+                snapshot[rel_prefix + name] = entry.stat().st_mtime
+            except OSError:
                 continue
 
+        # 스택이므로 역순으로 넣어야 이름순으로 꺼내진다
+        stack.extend(reversed(subdirs))
+
+    return snapshot
+
+
+def build_snapshots(roots: Iterable[Path], rules: dict) -> Dict[str, float]:
+    """
+    여러 watch_path 루트를 스레드 풀에서 동시에 훑어 하나의 dict로 합친다.
+    키는 "<폴더명>/<상대경로>" 형태이고, 합치는 순서는 roots 순서 그대로다. (결과 순서 결정적)
+    디렉터리 순회/stat은 GIL을 놓고 대기하므로 루트 수만큼 겹쳐서 처리된다.
+    """
+    roots = list(roots)
+    if len(roots) <= 1:
+        snapshot: Dict[str, float] = {}
+        for root in roots:
+            build_snapshot(root, rules, out=snapshot, prefix=root.name)
+        return snapshot
+
+    with ThreadPoolExecutor(max_workers=len(roots)) as ex:
+        parts = list(ex.map(lambda root: build_snapshot(root, rules, prefix=root.name), roots))
+
+    snapshot = parts[0]
+    for part in parts[1:]:
+        snapshot.update(part)
     return snapshot
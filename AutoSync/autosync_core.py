@@ -4,15 +4,13 @@ import datetime
 import json
 from structure_scanner import scan_structure
 from file_patcher import apply_patch
-from diff_checker import check_diff
+from diff_checker import check_diff, commit_diff
 from json_writer import write_json_version
-from excel_writer import write_excel_version
-from pdf_writer import write_pdf_version
 from webrack_core import update_site_root
 from safeguard_core import validate_patch
 
-# 🔥 추가: DeployBridge import
-from deploybridge_core import trigger_deploy
+# Excel/PDF 작성기(openpyxl, reportlab)와 DeployBridge(requests)는 무거우므로
+# 변경사항이 있고 SafeGuard를 통과했을 때만 autosync_run 안에서 import 한다.
 
 
 def autosync_run():
@@ -41,6 +39,10 @@ def autosync_run():
         print("❌ [AutoSync] SafeGuard FAIL → 자동배포 중단")
         return
 
+    from excel_writer import write_excel_version
+    from pdf_writer import write_pdf_version
+    from deploybridge_core import trigger_deploy
+
     print("📄 [AutoSync] VersionDocs 생성(JSON/Excel/PDF)...")
     write_json_version()
     write_excel_version()
@@ -54,4 +56,12 @@ def autosync_run():
     deploy_result = trigger_deploy("autosync_runtime")
     print("🌐 [AutoSync] DeployBridge Result:", deploy_result)
 
+    # 배포까지 성공(2xx)한 경우에만 구조를 기록 → 다음 실행에서 구조가 같으면 위의 "변경사항 없음"으로 바로 종료
+    # (배포 실패 시 기록하지 않으므로 다음 실행에서 다시 배포를 시도)
+    status_code = deploy_result.get("status_code")
+    if status_code is None or not 200 <= status_code < 300:
+        print("⚠️ [AutoSync] 배포 실패 → 구조 해시를 기록하지 않음 (다음 실행에서 재시도)")
+        return
+    commit_diff(scan_structure())
+
     print("🎉 [AutoSync] 전체 루프 완료.")
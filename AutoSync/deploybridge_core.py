@@ -1,12 +1,36 @@
 # 파일명: deploybridge_core.py
 # 목적: CAPS에서 Netlify Build Hook을 호출해 자동 배포를 실행하는 모듈
 
-import requests
-import json
 import datetime
 
 NETLIFY_BUILD_HOOK = "https://api.netlify.com/build_hooks/692d7279c2aea219056a09f1"
 
+# (연결, 응답) 타임아웃(초)
+DEPLOY_TIMEOUT = (3, 10)
+
+# 모듈 공용 세션: 두 번째 배포부터는 기존 TCP/TLS 연결을 재사용한다
+_SESSION = None
+
+
+def _get_session():
+    """
+    첫 배포 때 requests를 import 하고 세션을 만든다. (배포하지 않는 실행은 import 비용 없음)
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers["Content-Type"] = "application/json"
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.2)),
+        )
+        _SESSION = session
+    return _SESSION
+
 def trigger_deploy(source="CAPS-AutoSync"):
     """
     CAPS(WebRack)가 site_root를 생성한 후
@@ -18,11 +42,7 @@ def trigger_deploy(source="CAPS-AutoSync"):
     }
 
     try:
-        res = requests.post(
-            NETLIFY_BUILD_HOOK,
-            data=json.dumps(payload),
-            headers={"Content-Type": "application/json"}
-        )
+        res = _get_session().post(NETLIFY_BUILD_HOOK, json=payload, timeout=DEPLOY_TIMEOUT)
         return {
             "status_code": res.status_code,
             "response": res.text
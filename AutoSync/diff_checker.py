@@ -1,11 +1,58 @@
 # diff_checker.py
 # AutoSync 4.0 - 변경 감지 최소 모듈
 
+import hashlib
+import json
+import os
+
+# 마지막으로 전체 루프를 끝까지 돌았을 때의 구조 해시 (삭제하면 다음 실행은 무조건 "변경 있음")
+HASH_FILE = os.path.join("state", "last_structure_hash.bin")
+
+
+def structure_hash(structure_info, base_dir="."):
+    """
+    scan_structure 결과(폴더 → 파일명 목록)에 파일별 (st_mtime_ns, st_size)를 더해
+    키 정렬된 JSON으로 만든 뒤 blake2b(16바이트) 해시를 구한다.
+    파일 목록이 같아도 내용이 수정되면 mtime/size가 바뀌므로 해시가 달라진다.
+    """
+    stamped = {}
+    for rel_root, files in structure_info.items():
+        entries = []
+        for name in files:
+            try:
+                st = os.stat(os.path.join(base_dir, rel_root, name))
+                entries.append([name, st.st_mtime_ns, st.st_size])
+            except OSError:
+                # 스캔 후 삭제된 파일
+                entries.append([name, None, None])
+        stamped[rel_root] = entries
+    data = json.dumps(stamped, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest()
+
+
 def check_diff(structure_info):
     """
     구조 변화가 있는지 최소한의 수준으로만 감지.
-    기본적으로 항상 "변경 있음" 처리하여 AutoSync 테스트가 가능하도록 구성.
-    필요하면 고도화 가능.
+    직전 완료 실행의 구조 해시와 같으면 {} (변경 없음), 다르면 {"changed": True, "hash": ...}.
+    """
+    new_hash = structure_hash(structure_info)
+    try:
+        with open(HASH_FILE, "rb") as f:
+            if f.read() == new_hash:
+                return {}
+    except OSError:
+        pass
+    return {"changed": True, "hash": new_hash.hex()}
+
+
+def commit_diff(structure_info):
+    """
+    루프가 끝까지 성공했을 때 호출 → 구조 해시를 기록해 다음 실행에서 같은 구조면 건너뛴다.
+    루프가 만든 VersionDocs/site_root까지 반영되도록 실행 후 다시 스캔한 구조를 넘긴다.
+    (중간에 SafeGuard 등에서 멈춘 실행은 기록하지 않으므로 다음 실행에서 다시 시도)
     """
-    # 여기서는 단순히 항상 diff 있다고 가정 (테스트 편의)
-    return {"changed": True}
+    os.makedirs(os.path.dirname(HASH_FILE), exist_ok=True)
+    tmp = HASH_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(structure_hash(structure_info))
+    os.replace(tmp, HASH_FILE)
@@ -1,16 +1,34 @@
 # excel_writer.py
 # AutoSync 4.0 - VersionDocs(Excel)
 
-from openpyxl import Workbook
 from datetime import datetime
 
+# xlsxwriter가 있으면 행을 바로 파일로 흘려 쓰고(openpyxl보다 import/메모리 부담이 작음), 없으면 openpyxl 사용
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+HEADER = ["VersionDoc Type", "Generated At"]
+
+
 def write_excel_version():
+    row = ["excel_version_doc", datetime.now().isoformat()]
+
+    if xlsxwriter is not None:
+        wb = xlsxwriter.Workbook("AS_version_doc.xlsx", {"constant_memory": True})
+        ws = wb.add_worksheet()
+        ws.write_row(0, 0, HEADER)
+        ws.write_row(1, 0, row)
+        wb.close()
+        return True
+
+    from openpyxl import Workbook
+
     wb = Workbook()
     ws = wb.active
-    ws["A1"] = "VersionDoc Type"
-    ws["B1"] = "Generated At"
-    ws["A2"] = "excel_version_doc"
-    ws["B2"] = datetime.now().isoformat()
+    ws.append(HEADER)
+    ws.append(row)
 
     wb.save("AS_version_doc.xlsx")
     return True
@@ -0,0 +1,90 @@
+# json_io.py
+# AutoSync - JSON 직렬화 공용 모듈
+# orjson이 설치되어 있으면 orjson(C 구현)을 사용하고, 없으면 표준 json으로 동작한다.
+
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# CAPS_DURABLE=1 이면 원자적 쓰기 시 fsync까지 수행한다 (전원 차단 대비, 기본은 꺼짐)
+DURABLE = os.environ.get("CAPS_DURABLE") == "1"
+
+# CAPS_PRETTY=1 이면 state 등 프로그램이 읽는 파일도 사람이 보기 좋게 들여쓰기 한다 (디버깅용)
+PRETTY = os.environ.get("CAPS_PRETTY") == "1"
+
+
+def dumps(obj, pretty=False) -> bytes:
+    """
+    obj를 UTF-8 JSON bytes로 직렬화한다.
+    pretty=True 이면 2칸 들여쓰기로 출력한다. (한글은 escape 없이 그대로 기록)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """
+    bytes(또는 str) JSON을 파싱한다.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path):
+    """
+    JSON 파일을 읽어 파싱한다.
+    orjson이 있으면 파일을 mmap으로 매핑해 버퍼를 그대로 넘긴다. (read() 복사 1회 절약)
+    """
+    with open(path, "rb") as fp:
+        if orjson is None:
+            return json.loads(fp.read())
+        try:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap 할 수 없음 → 일반 read로 처리 (파싱 오류는 그대로 전달)
+            return orjson.loads(fp.read())
+        try:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
+
+def write_atomic(path, data: bytes, durable=None):
+    """
+    data를 임시 파일(<path>.tmp)에 쓴 뒤 os.replace로 교체한다.
+    쓰는 도중 중단되어도 기존 파일은 깨지지 않는다.
+    durable=True(기본값은 CAPS_DURABLE 환경변수)이면 파일과 상위 폴더까지 fsync 한다.
+    """
+    if durable is None:
+        durable = DURABLE
+    path = os.fspath(path)
+    tmp = path + ".tmp"
+
+    with open(tmp, "wb") as fp:
+        fp.write(data)
+        if durable:
+            fp.flush()
+            os.fsync(fp.fileno())
+    os.replace(tmp, path)
+
+    if durable and os.name != "nt":
+        # 이름 변경(rename) 자체를 디스크에 반영 (Windows는 폴더 fsync 미지원)
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
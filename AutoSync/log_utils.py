@@ -0,0 +1,141 @@
+# log_utils.py
+# AutoSync - 로그 기록 공용 모듈
+# 호출 측은 로그 레코드를 큐에 넣기만 하고, 파일/콘솔 기록은 QueueListener 스레드가 처리한다.
+
+import atexit
+import logging
+import queue
+import sys
+import time
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+LOG_FORMAT = "[%(asctime)s] %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+class SecondCachedFormatter(logging.Formatter):
+    """
+    asctime 문자열을 초 단위로 캐시하는 Formatter.
+    같은 초 안에 찍히는 로그는 strftime을 다시 호출하지 않는다.
+    """
+
+    def __init__(self, fmt=LOG_FORMAT, datefmt=LOG_DATEFMT):
+        super().__init__(fmt, datefmt)
+        self._cached_sec = -1
+        self._cached_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_str = time.strftime(datefmt or self.datefmt, time.localtime(sec))
+            self._cached_sec = sec
+        return self._cached_str
+
+
+_ts_sec = -1
+_ts_str = ""
+
+
+def now_str():
+    """
+    현재 시각을 "YYYY-mm-dd HH:MM:SS" 문자열로 반환한다.
+    같은 초 안에서는 캐시된 문자열을 그대로 돌려준다. (safe_print 등에서 사용)
+    """
+    global _ts_sec, _ts_str
+    sec = int(time.time())
+    if sec != _ts_sec:
+        _ts_str = time.strftime(LOG_DATEFMT, time.localtime(sec))
+        _ts_sec = sec
+    return _ts_str
+
+
+# (logs_dir, prefix) → logger  (같은 로그 파일은 리스너 하나만 사용)
+_LOGGERS = {}
+
+
+class DailyBufferedHandler(logging.Handler):
+    """
+    날짜별 로그 파일(<prefix>_YYYYMMDD.txt)에 버퍼링해서 기록하는 핸들러.
+    - 날짜는 record.created 기준이며, 자정을 넘었을 때만 파일을 다시 연다.
+    - flush_every 건이 쌓이거나 대기 중인 레코드가 없으면 디스크로 flush 한다.
+    """
+
+    def __init__(self, logs_dir, prefix, pending=None, flush_every=50):
+        super().__init__()
+        self.logs_dir = Path(logs_dir)
+        self.prefix = prefix
+        self.pending = pending
+        self.flush_every = flush_every
+        self.setFormatter(SecondCachedFormatter())
+
+        self._fp = None
+        self._day_start = 0.0
+        self._day_end = 0.0
+        self._unflushed = 0
+
+    def _open_for(self, created):
+        if self._fp is not None:
+            self._fp.close()
+        day = datetime.fromtimestamp(created).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._day_start = day.timestamp()
+        self._day_end = (day + timedelta(days=1)).timestamp()
+        log_path = self.logs_dir / f"{self.prefix}_{day.strftime('%Y%m%d')}.txt"
+        self._fp = open(log_path, "ab", buffering=1 << 16)
+
+    def emit(self, record):
+        try:
+            if not (self._day_start <= record.created < self._day_end):
+                self._open_for(record.created)
+            self._fp.write((self.format(record) + "\n").encode("utf-8"))
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every or (self.pending is not None and self.pending.empty()):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        if self._fp is not None:
+            self._fp.flush()
+        self._unflushed = 0
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        super().close()
+
+
+def get_queue_logger(logs_dir, prefix):
+    """
+    logs_dir/<prefix>_YYYYMMDD.txt 에 기록하는 로거를 반환한다.
+    로거는 QueueHandler만 가지며, 실제 기록은 백그라운드 QueueListener가 담당한다.
+    같은 (logs_dir, prefix)로 여러 번 호출하면 같은 로거를 돌려준다.
+    """
+    key = (str(logs_dir), prefix)
+    logger = _LOGGERS.get(key)
+    if logger is not None:
+        return logger
+
+    q = queue.SimpleQueue()
+    file_handler = DailyBufferedHandler(logs_dir, prefix, pending=q)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(file_handler.formatter)
+
+    listener = QueueListener(q, file_handler, console_handler)
+    listener.start()
+    atexit.register(_stop_listener, listener, file_handler)
+
+    logger = logging.getLogger(f"autosync.{prefix}.{len(_LOGGERS)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(QueueHandler(q))
+
+    _LOGGERS[key] = logger
+    return logger
+
+
+def _stop_listener(listener, file_handler):
+    # 남은 레코드를 모두 기록한 뒤 파일을 닫는다
+    listener.stop()
+    file_handler.close()
@@ -3,6 +3,9 @@
 
 import os
 
+# 스캔하지 않을 폴더 (AutoSync 내부 파일/캐시). 하위 트리째로 건너뛴다
+EXCLUDE_DIRS = frozenset({"__pycache__", "logs", "state", ".git", ".venv", "node_modules"})
+
 def scan_structure(base_dir="."):
     """
     AutoSync가 변경 여부를 판단하기 위해
@@ -11,15 +14,11 @@ def scan_structure(base_dir="."):
     structure = {}
 
     for root, dirs, files in os.walk(base_dir):
-        # AutoSync 내부 파일들은 제외
-        if "__pycache__" in root:
-            continue
-        if "logs" in root:
-            continue
-        if "state" in root:
-            continue
+        # 제외 폴더는 내려가기 전에 목록에서 빼서 하위 트리 전체를 건너뛴다
+        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
 
         rel_root = os.path.relpath(root, base_dir)
-        structure[rel_root] = sorted(files)
+        files.sort()
+        structure[rel_root] = files
 
     return structure
@@ -16,9 +16,16 @@ CAPS Core v1.0
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, asdict
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ─────────────────────────────────────────────
@@ -28,6 +35,51 @@ from typing import Dict, List, Optional
 CAPS_CORE_VERSION = "1.0.0"
 CAPS_CORE_INTERNAL_NAME = "CAPS Core"
 
+# 기본 베이스 디렉터리 = 이 파일이 있는 폴더 (인스턴스마다 resolve 하지 않도록 한 번만 계산)
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# LTS 직렬 의존성 순서 (Root Layer 제외: Nomad, Control Tower)
+# AutoSync → SafeGuard → VersionDocs → Scheduler/Omega → DeployBridge → WebRack → Image계층 → 모니터링/로그
+DEPENDENCY_ORDER: Tuple[str, ...] = (
+    "AutoSync",
+    "SafeGuard",
+    "VersionDocs",
+    "Scheduler",
+    "OmegaEngine",
+    "DeployBridge",
+    "WebRack",
+    "ImageInference",
+    "MonitoringPanel",
+    "LogCenter",
+)
+
+
+# ─────────────────────────────────────────────
+# JSON 입출력 (orjson이 있으면 bytes 그대로 파싱/직렬화, 없으면 표준 json)
+# ─────────────────────────────────────────────
+
+# CAPS_PRETTY=1 이면 프로그램만 읽는 plan 파일도 들여쓰기해서 기록 (디버깅용, 기본은 한 줄 JSON)
+PRETTY = os.environ.get("CAPS_PRETTY") == "1"
+
+def _read_json(path: Path):
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path: Path, obj, pretty: bool = True) -> None:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, option=option)
+    elif pretty:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    path.write_bytes(data)
+
 
 # ─────────────────────────────────────────────
 # 데이터 모델
@@ -48,6 +100,10 @@ class PlanItem:
     priority: int          # 낮을수록 우선순위 높음 (0 > 10)
     reason: str
     target_version: Optional[str] = None
+    parallel_safe: bool = False   # True면 AutoSync가 plan 순서상 바로 이웃한 parallel_safe 항목과 동시에 실행할 수 있음
+
+
+_BY_PRIORITY = attrgetter("priority")
 
 
 # ─────────────────────────────────────────────
@@ -61,8 +117,7 @@ class CapsCore:
     """
 
     def __init__(self, base_dir: Optional[Path] = None) -> None:
-        # 기본 베이스 디렉터리 = 이 파일이 있는 폴더
-        self.base_dir = base_dir or Path(__file__).resolve().parent
+        self.base_dir = base_dir or _MODULE_DIR
 
         # 하위 디렉터리
         self.config_dir = self.base_dir / "config"
@@ -79,20 +134,8 @@ class CapsCore:
         self.modules: Dict[str, ModuleStatus] = {}
         self.plan_items: List[PlanItem] = []
 
-        # LTS 직렬 의존성 순서 (Root Layer 제외: Nomad, Control Tower)
-        # AutoSync → SafeGuard → VersionDocs → Scheduler/Omega → DeployBridge → WebRack → Image계층 → 모니터링/로그
-        self.dependency_order = [
-            "AutoSync",
-            "SafeGuard",
-            "VersionDocs",
-            "Scheduler",
-            "OmegaEngine",
-            "DeployBridge",
-            "WebRack",
-            "ImageInference",
-            "MonitoringPanel",
-            "LogCenter",
-        ]
+        # LTS 직렬 의존성 순서 (모든 인스턴스가 같은 불변 tuple을 공유)
+        self.dependency_order = DEPENDENCY_ORDER
 
     # ─────────────────────────────────────
     # 파일/디렉터리 유틸
@@ -125,12 +168,10 @@ class CapsCore:
                 "test_decoupling": True
             }
             # 초기 템플릿 저장 (나중에 수동/AutoSync로 수정 가능)
-            with open(self.lts_rules_path, "w", encoding="utf-8") as f:
-                json.dump(self.lts_rules, f, indent=2, ensure_ascii=False)
+            _write_json(self.lts_rules_path, self.lts_rules)
             return
 
-        with open(self.lts_rules_path, "r", encoding="utf-8") as f:
-            self.lts_rules = json.load(f)
+        self.lts_rules = _read_json(self.lts_rules_path)
 
     # ─────────────────────────────────────
     # 모듈 상태 로딩
@@ -145,8 +186,7 @@ class CapsCore:
                 f"modules_status.json 이 없습니다: {self.modules_status_path}"
             )
 
-        with open(self.modules_status_path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = _read_json(self.modules_status_path)
 
         modules: Dict[str, ModuleStatus] = {}
         for name, info in raw.items():
@@ -175,8 +215,8 @@ class CapsCore:
             "items": [asdict(item) for item in self.plan_items],
         }
 
-        with open(self.plan_output_path, "w", encoding="utf-8") as f:
-            json.dump(plan_dict, f, indent=2, ensure_ascii=False)
+        # plan은 AutoSync/SafeGuard만 읽으므로 압축 저장 (LTS 규칙 템플릿은 사람이 고치므로 들여쓰기 유지)
+        _write_json(self.plan_output_path, plan_dict, pretty=PRETTY)
 
     # ─────────────────────────────────────
     # 계획 생성 로직 (핵심)
@@ -189,6 +229,9 @@ class CapsCore:
         """
         self.plan_items.clear()
 
+        # LTS 규칙의 "parallel_safe_modules"에 적힌 모듈만 동시 실행 허용 (기본: 없음 → 전부 직렬)
+        parallel_safe = frozenset(self.lts_rules.get("parallel_safe_modules", ()))
+
         for index, module_name in enumerate(self.dependency_order):
             m = self.modules.get(module_name)
             if m is None:
@@ -232,12 +275,14 @@ class CapsCore:
                     action=action,
                     priority=priority,
                     reason=reason,
-                    target_version=m.target_version
+                    target_version=m.target_version,
+                    parallel_safe=m.name in parallel_safe
                 )
             )
 
-        # 우선순위 정렬 (priority 오름차순)
-        self.plan_items.sort(key=lambda x: x.priority)
+        # 우선순위 정렬 (priority 오름차순, 같으면 dependency 순서 유지)
+        # 밴드(+0/+5/+7/+50)가 모듈 index*10 위에 얹히므로 reason별 버킷을 이어 붙이면 순서가 달라진다 → 안정 정렬 유지
+        self.plan_items.sort(key=_BY_PRIORITY)
 
     # ─────────────────────────────────────
     # 요약 출력
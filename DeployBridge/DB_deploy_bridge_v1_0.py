@@ -25,7 +25,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -39,6 +42,57 @@ DEPLOY_BRIDGE_VERSION = "1.0.0"
 MODULE_NAME = "DeployBridge"
 
 
+# -----------------------------------------------------
+# 폴더 복사
+# -----------------------------------------------------
+
+def _copy_tree(src: Path, dst: Path) -> str:
+    """
+    src 폴더 전체를 dst(아직 없는 폴더)로 복사하고, 사용한 방식을 반환한다.
+    - Windows: robocopy /MT 멀티스레드 복사 (종료 코드 0~7이 성공)
+    - 그 외: cp -a
+    - 위 도구를 찾을 수 없으면 _parallel_copytree
+    """
+    if os.name == "nt":
+        cmd = ["robocopy", str(src), str(dst), "/E", "/MT:64", "/NFL", "/NDL", "/NJH", "/NJS"]
+        ok_max = 7
+    else:
+        dst.mkdir()
+        cmd = ["cp", "-a", f"{src}/.", str(dst)]
+        ok_max = 0
+
+    try:
+        res = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        _parallel_copytree(src, dst)
+        return "parallel-copy"
+
+    if res.returncode > ok_max:
+        raise OSError(f"{cmd[0]} 실패 (code={res.returncode}): {(res.stderr or res.stdout).strip()}")
+    return cmd[0]
+
+
+def _parallel_copytree(src: Path, dst: Path) -> None:
+    """
+    shutil.copytree 대체: 폴더는 순회하면서 먼저 만들고, 파일 복사(copy2)는 스레드 풀에서 동시에 수행한다.
+    작은 파일이 많을 때는 파일마다 기다리는 I/O 지연이 대부분이라 동시에 처리하면 빨라진다.
+    실패한 파일이 있으면 copytree와 같이 shutil.Error([(src, dst, 사유), ...])를 발생시킨다.
+    """
+    pairs = []
+    for root, _dirs, files in os.walk(src, followlinks=True):
+        rel = os.path.relpath(root, src)
+        out = os.fspath(dst) if rel == "." else os.path.join(dst, rel)
+        os.makedirs(out, exist_ok=True)
+        pairs.extend((os.path.join(root, name), os.path.join(out, name)) for name in files)
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        futures = [ex.submit(shutil.copy2, s, d) for s, d in pairs]
+
+    errors = [(s, d, str(f.exception())) for (s, d), f in zip(pairs, futures) if f.exception() is not None]
+    if errors:
+        raise shutil.Error(errors)
+
+
 # -----------------------------------------------------
 # 데이터 모델
 # -----------------------------------------------------
@@ -188,10 +242,10 @@ class DeployBridge:
 
         self._log(f"[{site_id}] 배포 시작: {cfg.src_dir} → {target_dir}")
 
-        # 디렉터리 전체 복사
-        shutil.copytree(cfg.src_dir, target_dir)
+        # 디렉터리 전체 복사 (OS 기본 복사 도구 우선)
+        method = _copy_tree(cfg.src_dir, target_dir)
 
-        self._log(f"[{site_id}] 배포 완료: {target_dir}")
+        self._log(f"[{site_id}] 배포 완료 ({method}): {target_dir}")
 
         return target_dir
 
@@ -27,10 +27,13 @@ from __future__ import annotations
 import argparse
 import json
 import hashlib
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from PIL import Image, ImageStat
 
@@ -41,6 +44,95 @@ from PIL import Image, ImageStat
 IMAGE_INFERENCE_VERSION = "1.0.0"
 MODULE_NAME = "ImageInference"
 
+# 밝기 평균 계산용 축소 크기 (긴 변 기준 픽셀)
+BRIGHTNESS_SAMPLE_SIZE = 256
+
+# 이미지가 이보다 적으면 프로세스 풀을 띄우지 않고 바로 처리
+PARALLEL_MIN_IMAGES = 8
+
+# 분석 대상 확장자 (소문자 비교)
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# 중복 1차 판정에 쓰는 파일 앞부분 크기 (이보다 작은 파일은 1차 키가 곧 전체 내용)
+QUICK_HASH_BYTES = 64 * 1024
+
+
+# -----------------------------------------------------
+# 품질 분석 (프로세스 풀 워커에서도 실행되므로 모듈 최상위 함수)
+# -----------------------------------------------------
+
+def _hash_image(img_path: Path) -> str:
+    # 파일 전체를 한 번에 읽지 않고 고정 버퍼로 나눠 읽으며 해시 (큰 사진도 메모리 사용량 일정)
+    with open(img_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+        return h.hexdigest()
+
+
+def _quick_key(img_path: Path) -> Tuple[int, bytes]:
+    """
+    중복 1차 판정용 키: (파일 크기, 앞 QUICK_HASH_BYTES 바이트의 blake2b).
+    키가 다르면 확실히 다른 파일이고, 같을 때만 _hash_image로 전체를 비교한다.
+    """
+    with open(img_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(QUICK_HASH_BYTES)
+    return size, hashlib.blake2b(head, digest_size=16).digest()
+
+
+def _analyze_image(img_path: Path, conf: dict) -> Tuple[List[str], Optional[str]]:
+    """
+    v1.0 스텁 기반 품질 분석:
+    - brightness 평균값
+    - 해상도 검사
+    (reasons, 로드 오류 메시지 또는 None)을 반환한다.
+    """
+    reasons = []
+    try:
+        with Image.open(img_path) as img:
+            width, height = img.size
+
+            # 밝기는 평균만 필요하므로 축소본으로 계산한다
+            # (JPEG은 draft로 디코딩 단계에서 축소, 나머지는 thumbnail로 축소)
+            img.draft("L", (BRIGHTNESS_SAMPLE_SIZE, BRIGHTNESS_SAMPLE_SIZE))
+            gray = img.convert("L")
+        gray.thumbnail((BRIGHTNESS_SAMPLE_SIZE, BRIGHTNESS_SAMPLE_SIZE), Image.NEAREST)
+        brightness = ImageStat.Stat(gray).mean[0]
+
+        # 밝기 검사
+        if brightness < conf["brightness_low_threshold"]:
+            reasons.append("too_dark")
+        elif brightness > conf["brightness_high_threshold"]:
+            reasons.append("too_bright")
+
+        # 해상도 검사
+        if width < conf["min_width"] or height < conf["min_height"]:
+            reasons.append("low_resolution")
+
+    except Exception as e:
+        reasons.append("load_error")
+        return reasons, str(e)
+
+    return reasons, None
+
+
+def _inspect_image(
+    img_path: Path, conf: dict, with_key: bool
+) -> Tuple[List[str], Optional[Tuple[int, bytes]], Optional[str]]:
+    """
+    이미지 하나를 분석하고, with_key면 중복 1차 키도 구한다. (reasons, quick_key 또는 None, 로드 오류 메시지)
+    밝기/해상도 검사에서 이미 bad로 분류된 이미지는 중복 검사가 필요 없으므로 파일을 더 읽지 않는다.
+    """
+    reasons, error = _analyze_image(img_path, conf)
+    if reasons or not with_key:
+        return reasons, None, error
+    return reasons, _quick_key(img_path), error
+
 
 # -----------------------------------------------------
 # 데이터 모델
@@ -127,45 +219,6 @@ class ImageInference:
 
         print(line, end="")
 
-    # -------------------------------------------------
-    # 품질 분석
-    # -------------------------------------------------
-    def _hash_image(self, img_path: Path) -> str:
-        h = hashlib.sha256()
-        with open(img_path, "rb") as f:
-            h.update(f.read())
-        return h.hexdigest()
-
-    def _analyze_image(self, img_path: Path) -> List[str]:
-        """
-        v1.0 스텁 기반 품질 분석:
-        - brightness 평균값
-        - 해상도 검사
-        """
-        reasons = []
-        try:
-            img = Image.open(img_path)
-            stat = ImageStat.Stat(img.convert("L"))
-
-            brightness = stat.mean[0]
-            width, height = img.size
-
-            # 밝기 검사
-            if brightness < self.conf["brightness_low_threshold"]:
-                reasons.append("too_dark")
-            elif brightness > self.conf["brightness_high_threshold"]:
-                reasons.append("too_bright")
-
-            # 해상도 검사
-            if width < self.conf["min_width"] or height < self.conf["min_height"]:
-                reasons.append("low_resolution")
-
-        except Exception as e:
-            reasons.append("load_error")
-            self._log(f"[ERROR] 이미지 로드 실패: {img_path} | {e}")
-
-        return reasons
-
     # -------------------------------------------------
     # 메인 분석 엔진
     # -------------------------------------------------
@@ -176,23 +229,54 @@ class ImageInference:
         if not dir_path.exists():
             raise FileNotFoundError(f"스캔 대상 디렉터리가 존재하지 않습니다: {dir_path}")
 
-        images = list(dir_path.glob("*.jpg")) + list(dir_path.glob("*.png"))
+        # 한 번의 scandir로 이름/종류/크기(DirEntry에 캐시된 stat)를 얻는다. 순서는 이름순
+        with os.scandir(dir_path) as it:
+            entries = sorted(
+                (e for e in it if e.is_file() and e.name.lower().endswith(IMAGE_EXTENSIONS)),
+                key=lambda e: e.name,
+            )
+        images = [Path(e.path) for e in entries]
         reasons_map: Dict[str, List[str]] = {}
         good, bad = [], []
 
-        seen_hashes = set()
-
-        for img_path in images:
+        # 크기가 같은 이미지가 없으면 중복일 수 없으므로 1차 키(파일 읽기)도 생략
+        sizes = [e.stat().st_size for e in entries]
+        size_counts = Counter(sizes)
+        with_keys = [size_counts[s] > 1 for s in sizes]
+
+        # 이미지별 분석/해시는 서로 독립적인 CPU 작업 → 프로세스 풀에서 동시에 처리 (결과 순서는 images 순서)
+        confs = [self.conf] * len(images)
+        if len(images) < PARALLEL_MIN_IMAGES:
+            results = list(map(_inspect_image, images, confs, with_keys))
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                results = list(ex.map(_inspect_image, images, confs, with_keys, chunksize=8))
+
+        # 중복 검사는 결과를 모은 뒤 메인 프로세스에서 순서대로
+        # 1차 키가 같은 이미지끼리만 전체 해시를 비교한다 (전체 해시는 필요할 때 한 번만 계산)
+        seen_keys: Dict[Tuple[int, bytes], List[Path]] = {}
+        full_hashes: Dict[Path, str] = {}
+
+        def full_hash(p: Path) -> str:
+            h = full_hashes.get(p)
+            if h is None:
+                h = full_hashes[p] = _hash_image(p)
+            return h
+
+        for img_path, (reason_list, key, error) in zip(images, results):
             img_name = img_path.name
-
-            reason_list = self._analyze_image(img_path)
-
-            # 중복 검사
-            img_hash = self._hash_image(img_path)
-            if img_hash in seen_hashes:
-                reason_list.append("duplicate")
-            else:
-                seen_hashes.add(img_hash)
+            if error:
+                self._log(f"[ERROR] 이미지 로드 실패: {img_path} | {error}")
+
+            # key가 None이면 이미 bad이거나 크기가 유일한 이미지 → 중복 검사 생략
+            if key is not None:
+                same_key = seen_keys.get(key)
+                if same_key is None:
+                    seen_keys[key] = [img_path]
+                elif key[0] <= QUICK_HASH_BYTES or any(full_hash(p) == full_hash(img_path) for p in same_key):
+                    reason_list.append("duplicate")
+                else:
+                    same_key.append(img_path)
 
             if reason_list:
                 bad.append(img_name)
@@ -34,7 +34,7 @@ def load_json(path: Path) -> Any:
 def save_json(path: Path, data: Any):
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(json.dumps(data, ensure_ascii=False, indent=2))
 
 
 def build_user_prompt(template: str, payload: Dict[str, Any]) -> str:
@@ -39,7 +39,7 @@ def load_json(path: Path) -> Any:
 def save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(json.dumps(data, ensure_ascii=False, indent=2))
 
 
 def build_draft_text(post: Dict[str, Any], template_cfg: Dict[str, Any]) -> str:
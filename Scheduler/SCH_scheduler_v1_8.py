@@ -41,7 +41,7 @@ def load_json(path, default=None):
 
 def save_json(path, data):
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(json.dumps(data, ensure_ascii=False, indent=2))
 
 def is_web_rack(client):
     return client.startswith("rack")
@@ -53,7 +53,7 @@ def load_json(path: Path, default=None):
 
 def save_json(path: Path, data):
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(json.dumps(data, ensure_ascii=False, indent=2))
 
 def ensure_settings():
     if not SETTINGS.exists():